@@ -2,6 +2,7 @@
 
 import dspy
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from powder.signatures import SkiRecommendation
@@ -198,6 +199,12 @@ def create_agent() -> dspy.ReAct:
     return agent
 
 
+@lru_cache(maxsize=1)
+def _get_agent() -> dspy.ReAct:
+    """One agent (tools and ReAct predictors) reused across recommend calls."""
+    return create_agent()
+
+
 def recommend(
     query: str,
     current_date: date | None = None,
@@ -214,7 +221,7 @@ def recommend(
     Returns:
         Recommendation string with top picks and reasoning.
     """
-    agent = create_agent()
+    agent = _get_agent()
     user_context = build_user_context(current_date, current_location)
 
     result = agent(query=query, user_context=user_context)
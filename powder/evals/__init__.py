@@ -1,25 +1 @@
 """Evaluation datasets and metrics for DSPy optimization."""
-
-# Individual signature evaluations
-from powder.evals import assess_conditions
-from powder.evals import parse_query
-from powder.evals import score_mountain
-from powder.evals import generate_recommendation
-
-# End-to-end evaluation
-from powder.evals import end_to_end
-
-# Runner
-from powder.evals.runner import run_all_evals, run_signature_eval
-
-__all__ = [
-    # Modules
-    "assess_conditions",
-    "parse_query",
-    "score_mountain",
-    "generate_recommendation",
-    "end_to_end",
-    # Functions
-    "run_all_evals",
-    "run_signature_eval",
-]
@@ -166,6 +166,17 @@ VAL_EXAMPLES = [BITTER_COLD]
 
 VALID_DAY_QUALITIES = {"excellent", "good", "fair", "poor", "stay_home"}
 
+# Any of these in day_context counts as mentioning the cold
+COLD_WORDS = ("cold", "frigid", "bitter", "freezing", "temperature", "frostbite")
+
+
+def day_quality_matches(expected, day_quality: str) -> bool:
+    """Whether day_quality is the expected quality, or one of a list of them."""
+    day_quality = day_quality.lower().strip()
+    if isinstance(expected, list):
+        return day_quality in [e.lower() for e in expected]
+    return day_quality == expected.lower()
+
 
 def assess_conditions_metric(example, pred, trace=None) -> float:
     """
@@ -196,11 +207,7 @@ def assess_conditions_metric(example, pred, trace=None) -> float:
 
     # 3. Accuracy: day_quality matches expected (if provided)
     if hasattr(example, "expected_day_quality"):
-        expected = example.expected_day_quality
-        if isinstance(expected, list):
-            matches = pred.day_quality.lower().strip() in [e.lower() for e in expected]
-        else:
-            matches = pred.day_quality.lower().strip() == expected.lower()
+        matches = day_quality_matches(example.expected_day_quality, pred.day_quality)
         scores.append(1.0 if matches else 0.0)
 
     # 4. Accuracy: mentions expected best mountain (if provided)
@@ -217,15 +224,7 @@ def assess_conditions_metric(example, pred, trace=None) -> float:
 
     # 6. Consistency: mentions cold if it's bitter cold (if expected)
     if hasattr(example, "expected_mention_cold") and example.expected_mention_cold:
-        cold_words = [
-            "cold",
-            "frigid",
-            "bitter",
-            "freezing",
-            "temperature",
-            "frostbite",
-        ]
-        mentions_cold = any(w in pred.day_context.lower() for w in cold_words)
+        mentions_cold = any(w in pred.day_context.lower() for w in COLD_WORDS)
         scores.append(1.0 if mentions_cold else 0.0)
 
     # Average all scores
@@ -257,7 +256,6 @@ def get_metric():
 
 if __name__ == "__main__":
     # Quick test: run the signature on examples and score
-    import dspy
     from powder.signatures import AssessConditions
 
     dspy.configure(lm=dspy.LM("anthropic/claude-haiku-4-5-20251001"))
@@ -13,6 +13,7 @@ Usage:
 
 import json
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
 from pathlib import Path
 from typing import Generator
@@ -168,8 +169,44 @@ def mock_weather_api(conditions: dict[str, dict]) -> Generator[None, None, None]
     Patches at all import locations to ensure mocking works for both
     Pipeline and ReAct agent.
     """
-    mock_fn = make_mock_conditions(conditions)
+    with _patch_get_conditions(make_mock_conditions(conditions)):
+        yield
+
+
+# Fixture selected by the example running in the current context; read by the
+# mock that mock_weather_api_by_context installs
+_ACTIVE_CONDITIONS: ContextVar[dict[str, dict]] = ContextVar("active_conditions")
+
+
+@contextmanager
+def use_conditions(conditions: dict[str, dict]) -> Generator[None, None, None]:
+    """Select the fixture mock_weather_api_by_context serves in this context."""
+    token = _ACTIVE_CONDITIONS.set(conditions)
+    try:
+        yield
+    finally:
+        _ACTIVE_CONDITIONS.reset(token)
+
 
+@contextmanager
+def mock_weather_api_by_context() -> Generator[None, None, None]:
+    """
+    Context manager that mocks the weather API once for many fixtures.
+
+    Each caller picks its fixture with use_conditions(), so examples from
+    different dates can run concurrently on separate threads under one patch.
+    """
+
+    def mock_fn(lat: float, lon: float, target_date) -> dict:
+        conditions = _ACTIVE_CONDITIONS.get()
+        return make_mock_conditions(conditions)(lat, lon, target_date)
+
+    with _patch_get_conditions(mock_fn):
+        yield
+
+
+@contextmanager
+def _patch_get_conditions(mock_fn: callable) -> Generator[None, None, None]:
     # Patch at all locations where get_conditions might be imported
     with patch("powder.pipeline.get_conditions", mock_fn), patch(
         "powder.tools.weather.get_conditions", mock_fn
@@ -17,10 +17,14 @@ Usage:
 
 import json
 import httpx
+import orjson
 from datetime import date, timedelta
 from pathlib import Path
 from time import sleep
 
+from powder.evals.find_interesting_days import save_day_metrics
+
+
 def get_mountains_from_db() -> list[dict]:
     """
     Load mountains from the database/JSONL file.
@@ -120,7 +124,8 @@ def fetch_mountain_season(
 
     response = httpx.get(ARCHIVE_URL, params=params, timeout=60)
     response.raise_for_status()
-    data = response.json()
+    # orjson is much faster than stdlib json on these float-heavy hourly arrays
+    data = orjson.loads(response.content)
 
     daily = data.get("daily", {})
     hourly = data.get("hourly", {})
@@ -275,17 +280,31 @@ def fetch_full_season(
     # Save combined by-date file
     successful_mountains = [k for k, v in all_data.items() if isinstance(v, dict) and "error" not in v]
     combined_file = output_dir / "by_date.json"
-    with open(combined_file, "w") as f:
-        json.dump({
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "mountains": successful_mountains,
-            "dates": by_date,
-        }, f)  # No indent - file would be huge
+    with open(combined_file, "wb") as f:
+        # Written one date at a time so we never hold the whole encoded file
+        # in memory. No indent - file would be huge.
+        f.write(
+            b'{"start_date":' + orjson.dumps(start_date.isoformat())
+            + b',"end_date":' + orjson.dumps(end_date.isoformat())
+            + b',"mountains":' + orjson.dumps(successful_mountains)
+            + b',"dates":{'
+        )
+        for i, (date_str, conditions) in enumerate(by_date.items()):
+            if i:
+                f.write(b",")
+            f.write(orjson.dumps(date_str) + b":" + orjson.dumps(conditions))
+        f.write(b"}}")
 
     print(f"Saved {combined_file} ({len(by_date)} dates, {len(successful_mountains)} mountains)")
 
-    # Save metadata
+    # Save precomputed per-day metrics for find_interesting_days
+    metrics_file = save_day_metrics(
+        {"mountains": successful_mountains, "dates": by_date}, output_dir
+    )
+    print(f"Saved {metrics_file}")
+
+    # Save metadata (includes summary lists so --summary never reads by_date.json)
+    top_powder_days, coldest_days = summarize_days(by_date)
     meta_file = output_dir / "metadata.json"
     with open(meta_file, "w") as f:
         json.dump({
@@ -295,12 +314,57 @@ def fetch_full_season(
             "total_days": len(by_date),
             "total_mountains": len(successful_mountains),
             "fetched_at": date.today().isoformat(),
+            "top_powder_days": top_powder_days,
+            "coldest_days": coldest_days,
         }, f, indent=2)
 
     print(f"\nDone! Data saved to {output_dir}")
     return by_date
 
 
+def summarize_days(
+    by_date: dict[str, dict],
+    powder_limit: int = 10,
+    cold_limit: int = 5,
+) -> tuple[list[dict], list[dict]]:
+    """
+    Find the best powder days and coldest days in a date-indexed dataset.
+
+    Computed once at fetch time and stored in metadata.json.
+
+    Returns:
+        (top_powder_days, coldest_days) as lists of JSON-serializable dicts
+    """
+    powder_days = []
+    cold_days = []
+    for date_str, conditions in by_date.items():
+        # Single sweep per day: track best fresh snow (and where) plus coldest temp
+        max_fresh = 0
+        best_mtn = ""
+        min_temp = 100
+        for name, c in conditions.items():
+            fresh = c.get("fresh_snow_24h_in", 0)
+            if fresh > max_fresh:
+                max_fresh = fresh
+                best_mtn = name
+            temp = c.get("temp_f", 100)
+            if temp < min_temp:
+                min_temp = temp
+
+        if max_fresh >= 6:  # 6+ inches
+            powder_days.append({
+                "date": date_str,
+                "mountain": best_mtn,
+                "fresh_snow_in": max_fresh,
+            })
+        if min_temp < 0:
+            cold_days.append({"date": date_str, "temp_f": min_temp})
+
+    powder_days.sort(key=lambda x: x["fresh_snow_in"], reverse=True)
+    cold_days.sort(key=lambda x: x["temp_f"])
+    return powder_days[:powder_limit], cold_days[:cold_limit]
+
+
 def load_conditions_for_date(target_date: date | str, fixtures_dir: Path = None) -> dict[str, dict]:
     """
     Load conditions for all mountains on a specific date.
@@ -353,47 +417,19 @@ def summarize_fixtures(fixtures_dir: Path = None):
     print(f"Fetched: {meta['fetched_at']}")
     print()
 
-    # Load by_date to find interesting days
-    by_date_file = fixtures_dir / "by_date.json"
-    if by_date_file.exists():
-        with open(by_date_file) as f:
-            data = json.load(f)
-            dates = data.get("dates", {})
+    top_powder_days = meta.get("top_powder_days")
+    coldest_days = meta.get("coldest_days")
+    if top_powder_days is None or coldest_days is None:
+        print("Metadata predates day summaries. Re-run 'python -m powder.evals.fetch_historic'.")
+        return
 
-        # Find best powder days
-        powder_days = []
-        for date_str, conditions in dates.items():
-            max_fresh = max(
-                (c.get("fresh_snow_24h_in", 0) for c in conditions.values()),
-                default=0
-            )
-            if max_fresh >= 6:  # 6+ inches
-                best_mtn = max(
-                    conditions.items(),
-                    key=lambda x: x[1].get("fresh_snow_24h_in", 0)
-                )
-                powder_days.append((date_str, best_mtn[0], max_fresh))
-
-        powder_days.sort(key=lambda x: x[2], reverse=True)
-
-        print("Top 10 powder days:")
-        for date_str, mtn, fresh in powder_days[:10]:
-            print(f"  {date_str}: {mtn} - {fresh:.1f}\" fresh")
-
-        # Find coldest days
-        print("\nColdest days:")
-        cold_days = []
-        for date_str, conditions in dates.items():
-            min_temp = min(
-                (c.get("temp_f", 100) for c in conditions.values()),
-                default=100
-            )
-            if min_temp < 0:
-                cold_days.append((date_str, min_temp))
+    print("Top 10 powder days:")
+    for day in top_powder_days:
+        print(f"  {day['date']}: {day['mountain']} - {day['fresh_snow_in']:.1f}\" fresh")
 
-        cold_days.sort(key=lambda x: x[1])
-        for date_str, temp in cold_days[:5]:
-            print(f"  {date_str}: {temp:.0f}°F")
+    print("\nColdest days:")
+    for day in coldest_days:
+        print(f"  {day['date']}: {day['temp_f']:.0f}°F")
 
 
 def main():
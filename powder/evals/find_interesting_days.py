@@ -16,13 +16,16 @@ Usage:
     python -m powder.evals.find_interesting_days --date 2025-01-15
 """
 
+import heapq
 import json
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class DayAnalysis:
     """Analysis of a single day's conditions across mountains."""
     date_str: str
@@ -89,6 +92,76 @@ def load_historic_data(fixtures_dir: Path = None) -> dict:
         return json.load(f)
 
 
+# DayAnalysis fields persisted to day_metrics.json (one column per field)
+METRIC_FIELDS = (
+    "max_fresh_snow",
+    "min_fresh_snow",
+    "avg_fresh_snow",
+    "snow_variance",
+    "best_snow_mountain",
+    "worst_snow_mountain",
+    "coldest_temp",
+    "warmest_temp",
+    "coldest_mountain",
+    "warmest_mountain",
+)
+
+
+def save_day_metrics(data: dict, fixtures_dir: Path = None) -> Path:
+    """
+    Precompute per-day metrics and save them to day_metrics.json.
+
+    Written once at fetch time so later runs can skip parsing by_date.json
+    and recomputing metrics. Stored column-wise: one list per metric field.
+    """
+    if fixtures_dir is None:
+        fixtures_dir = Path(__file__).parent / "fixtures"
+
+    analyses = analyze_all_days(data)
+    columns = {
+        "mountains": data.get("mountains", []),
+        "dates": [a.date_str for a in analyses],
+    }
+    for name in METRIC_FIELDS:
+        columns[name] = [getattr(a, name) for a in analyses]
+
+    metrics_file = fixtures_dir / "day_metrics.json"
+    with open(metrics_file, "wb") as f:
+        f.write(orjson.dumps(columns))
+    return metrics_file
+
+
+def load_day_metrics(fixtures_dir: Path = None) -> tuple[list[DayAnalysis], list[str]] | None:
+    """
+    Load precomputed metrics from day_metrics.json.
+
+    Returned analyses have empty `mountains` dicts - use load_historic_data()
+    when per-mountain conditions are needed.
+
+    Returns:
+        (analyses, mountain_names), or None if the file doesn't exist
+    """
+    if fixtures_dir is None:
+        fixtures_dir = Path(__file__).parent / "fixtures"
+
+    metrics_file = fixtures_dir / "day_metrics.json"
+    if not metrics_file.exists():
+        return None
+
+    with open(metrics_file, "rb") as f:
+        columns = orjson.loads(f.read())
+
+    analyses = [
+        DayAnalysis(
+            date_str=date_str,
+            mountains={},
+            **{name: columns[name][i] for name in METRIC_FIELDS},
+        )
+        for i, date_str in enumerate(columns["dates"])
+    ]
+    return analyses, columns["mountains"]
+
+
 def analyze_all_days(data: dict) -> list[DayAnalysis]:
     """Analyze all days in the dataset."""
     dates_data = data.get("dates", {})
@@ -107,9 +180,8 @@ def find_powder_days(analyses: list[DayAnalysis], limit: int = 10) -> list[DayAn
     Find days with high snow variance - some mountains got powder, others didn't.
     These are great test cases because there's a clear "right" answer.
     """
-    # Sort by snow variance (difference between best and worst)
-    sorted_days = sorted(analyses, key=lambda a: a.snow_variance, reverse=True)
-    return sorted_days[:limit]
+    # Top by snow variance (difference between best and worst)
+    return heapq.nlargest(limit, analyses, key=lambda a: a.snow_variance)
 
 
 def find_big_snow_days(analyses: list[DayAnalysis], limit: int = 10) -> list[DayAnalysis]:
@@ -117,8 +189,7 @@ def find_big_snow_days(analyses: list[DayAnalysis], limit: int = 10) -> list[Day
     Find days with the most fresh snow overall.
     Good for testing powder-chasing queries.
     """
-    sorted_days = sorted(analyses, key=lambda a: a.max_fresh_snow, reverse=True)
-    return sorted_days[:limit]
+    return heapq.nlargest(limit, analyses, key=lambda a: a.max_fresh_snow)
 
 
 def find_cold_days(analyses: list[DayAnalysis], limit: int = 10) -> list[DayAnalysis]:
@@ -126,8 +197,7 @@ def find_cold_days(analyses: list[DayAnalysis], limit: int = 10) -> list[DayAnal
     Find the coldest days.
     Good for testing weather-conscious recommendations.
     """
-    sorted_days = sorted(analyses, key=lambda a: a.coldest_temp)
-    return sorted_days[:limit]
+    return heapq.nsmallest(limit, analyses, key=lambda a: a.coldest_temp)
 
 
 def find_clear_winner_days(analyses: list[DayAnalysis], limit: int = 10) -> list[DayAnalysis]:
@@ -140,8 +210,7 @@ def find_clear_winner_days(analyses: list[DayAnalysis], limit: int = 10) -> list
         a for a in analyses
         if a.max_fresh_snow >= 4 and a.snow_variance >= 3
     ]
-    sorted_days = sorted(candidates, key=lambda a: a.snow_variance, reverse=True)
-    return sorted_days[:limit]
+    return heapq.nlargest(limit, candidates, key=lambda a: a.snow_variance)
 
 
 def find_ambiguous_days(analyses: list[DayAnalysis], limit: int = 10) -> list[DayAnalysis]:
@@ -154,8 +223,7 @@ def find_ambiguous_days(analyses: list[DayAnalysis], limit: int = 10) -> list[Da
         a for a in analyses
         if a.snow_variance < 2 and a.avg_fresh_snow >= 1
     ]
-    sorted_days = sorted(candidates, key=lambda a: a.avg_fresh_snow, reverse=True)
-    return sorted_days[:limit]
+    return heapq.nlargest(limit, candidates, key=lambda a: a.avg_fresh_snow)
 
 
 def print_day_summary(analysis: DayAnalysis, verbose: bool = False):
@@ -240,16 +308,13 @@ def main():
 
     args = parser.parse_args()
 
-    # Load data
-    try:
-        data = load_historic_data()
-    except FileNotFoundError as e:
-        print(f"Error: {e}")
-        return
-
     # Single date lookup
     if args.date:
-        analysis = get_day_details(args.date)
+        try:
+            analysis = get_day_details(args.date)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return
         if analysis:
             print(f"\n=== Conditions for {args.date} ===")
             print_day_summary(analysis, verbose=True)
@@ -257,8 +322,18 @@ def main():
             print(f"No data for {args.date}")
         return
 
-    # Analyze all days
-    analyses = analyze_all_days(data)
+    # Use precomputed metrics unless we need per-mountain conditions (--verbose)
+    precomputed = None if args.verbose else load_day_metrics()
+    if precomputed:
+        analyses, mountain_names = precomputed
+    else:
+        try:
+            data = load_historic_data()
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return
+        analyses = analyze_all_days(data)
+        mountain_names = data.get("mountains", [])
 
     if args.json:
         candidates = generate_eval_candidates(analyses)
@@ -280,7 +355,7 @@ def main():
 
     print(f"\n=== Interesting Days Analysis ===")
     print(f"Total days: {len(analyses)}")
-    print(f"Mountains: {len(data.get('mountains', []))}")
+    print(f"Mountains: {len(mountain_names)}")
 
     if args.type in ("powder", "all"):
         print(f"\n--- High Snow Variance (Powder at some, not others) ---")
@@ -10,9 +10,51 @@ Metrics are rule-based:
 """
 
 import json
+from typing import NamedTuple
+
 import dspy
 
 
+# Expected keyword/mountain lists that get a lowercased "<key>_lower" companion
+LOWERED_FIELDS = (
+    "expected_top_pick",
+    "expected_alternatives_mention",
+    "expected_top_pick_keywords",
+    "expected_caveat_keywords",
+)
+
+PASS_WORDS = ("pass", "ikon", "epic", "indy", "ticket")
+
+
+class _Normalized(NamedTuple):
+    """Lowercased prediction text, built once per metric call."""
+
+    top_pick_lower: str
+    alts_lower: str
+    caveat_lower: str
+    full_lower: str
+
+
+def _normalize(pred: dspy.Prediction) -> _Normalized:
+    top_pick_lower = pred.top_pick.lower()
+    alts_lower = pred.alternatives.lower()
+    caveat_lower = pred.caveat.lower()
+    return _Normalized(
+        top_pick_lower,
+        alts_lower,
+        caveat_lower,
+        " ".join((top_pick_lower, alts_lower, caveat_lower)),
+    )
+
+
+def _lowered(example: dspy.Example, key: str) -> tuple[str, ...]:
+    """example.<key>_lower, or example.<key> lowercased for hand-built examples."""
+    lowered = example.get(f"{key}_lower")
+    if lowered is None:
+        lowered = tuple(v.lower() for v in example[key])
+    return lowered
+
+
 def make_example(
     query: str,
     day_assessment: str,
@@ -20,13 +62,23 @@ def make_example(
     crowd_context: dict,
     expected: dict,
 ) -> dspy.Example:
-    """Create a GenerateRecommendation evaluation example."""
+    """Create a GenerateRecommendation evaluation example.
+
+    Lowercased copies of the expected lists are precomputed here so the
+    metric only does substring checks.
+    """
+    lowered = {
+        f"{key}_lower": tuple(v.lower() for v in expected[key])
+        for key in LOWERED_FIELDS
+        if key in expected
+    }
     return dspy.Example(
         query=query,
         day_assessment=day_assessment,
         scored_candidates=json.dumps(scored_candidates),
         crowd_context=json.dumps(crowd_context),
         **expected,
+        **lowered,
     ).with_inputs("query", "day_assessment", "scored_candidates", "crowd_context")
 
 
@@ -298,48 +350,47 @@ def generate_recommendation_metric(
         Float between 0 and 1
     """
     scores = []
+    text = _normalize(pred)
 
     # 1. Top pick correctness
     if hasattr(example, "expected_top_pick"):
-        acceptable = example.expected_top_pick
-        top_pick_lower = pred.top_pick.lower()
-        matches = any(mtn.lower() in top_pick_lower for mtn in acceptable)
+        matches = any(
+            mtn in text.top_pick_lower
+            for mtn in _lowered(example, "expected_top_pick")
+        )
         scores.append(1.0 if matches else 0.0)
 
     # 2. Alternatives grounding - mentions real mountains
     if hasattr(example, "expected_alternatives_mention"):
-        expected_mtns = example.expected_alternatives_mention
-        alts_lower = pred.alternatives.lower()
-        matches = sum(1 for mtn in expected_mtns if mtn.lower() in alts_lower)
         # At least 1 expected alternative should be mentioned
-        scores.append(1.0 if matches >= 1 else 0.5 if alts_lower else 0.0)
+        matches = any(
+            mtn in text.alts_lower
+            for mtn in _lowered(example, "expected_alternatives_mention")
+        )
+        scores.append(1.0 if matches else 0.5 if text.alts_lower else 0.0)
 
     # 3. Top pick keywords
     if hasattr(example, "expected_top_pick_keywords"):
-        keywords = example.expected_top_pick_keywords
-        top_pick_lower = pred.top_pick.lower()
-        matches = sum(1 for kw in keywords if kw.lower() in top_pick_lower)
         # At least 1 keyword should appear
-        scores.append(min(matches / 1, 1.0))
+        matches = any(
+            kw in text.top_pick_lower
+            for kw in _lowered(example, "expected_top_pick_keywords")
+        )
+        scores.append(1.0 if matches else 0.0)
 
     # 4. Caveat keywords (when expected)
     if hasattr(example, "expected_caveat_keywords"):
-        keywords = example.expected_caveat_keywords
-        # Check both caveat and top_pick for these concerns
-        full_text = (
-            pred.caveat + " " + pred.top_pick + " " + pred.alternatives
-        ).lower()
-        matches = sum(1 for kw in keywords if kw.lower() in full_text)
-        scores.append(1.0 if matches >= 1 else 0.0)
+        # Check caveat, top_pick and alternatives for these concerns
+        matches = any(
+            kw in text.full_lower
+            for kw in _lowered(example, "expected_caveat_keywords")
+        )
+        scores.append(1.0 if matches else 0.0)
 
     # 5. Pass awareness (special check)
     if hasattr(example, "expected_pass_awareness") and example.expected_pass_awareness:
         # Check if pass type is mentioned in recommendation
-        full_text = (
-            pred.top_pick + " " + pred.alternatives + " " + pred.caveat
-        ).lower()
-        pass_words = ["pass", "ikon", "epic", "indy", "ticket"]
-        mentions_pass = any(pw in full_text for pw in pass_words)
+        mentions_pass = any(pw in text.full_lower for pw in PASS_WORDS)
         scores.append(1.0 if mentions_pass else 0.0)
 
     # 6. Non-empty outputs
@@ -381,9 +432,17 @@ def score_detailed(example: dspy.Example, pred: dspy.Prediction) -> dict:
         "caveat": pred.caveat[:100] if pred.caveat else "",
     }
 
+    text = _normalize(pred)
+
     if hasattr(example, "expected_top_pick"):
         acceptable = example.expected_top_pick
-        matches = [mtn for mtn in acceptable if mtn.lower() in pred.top_pick.lower()]
+        matches = [
+            mtn
+            for mtn, mtn_lower in zip(
+                acceptable, _lowered(example, "expected_top_pick")
+            )
+            if mtn_lower in text.top_pick_lower
+        ]
         details["top_pick_check"] = {
             "expected_any": acceptable,
             "found": matches,
@@ -391,20 +450,42 @@ def score_detailed(example: dspy.Example, pred: dspy.Prediction) -> dict:
         }
 
     if hasattr(example, "expected_caveat_keywords"):
-        full_text = (pred.caveat + " " + pred.top_pick).lower()
         found = [
-            kw for kw in example.expected_caveat_keywords if kw.lower() in full_text
+            kw
+            for kw, kw_lower in zip(
+                example.expected_caveat_keywords,
+                _lowered(example, "expected_caveat_keywords"),
+            )
+            if kw_lower in text.full_lower
         ]
         details["caveat_check"] = {
             "expected_any": example.expected_caveat_keywords,
             "found": found,
         }
 
+    if hasattr(example, "expected_alternatives_mention"):
+        found = [
+            mtn
+            for mtn, mtn_lower in zip(
+                example.expected_alternatives_mention,
+                _lowered(example, "expected_alternatives_mention"),
+            )
+            if mtn_lower in text.alts_lower
+        ]
+        details["alternatives_check"] = {
+            "expected_any": example.expected_alternatives_mention,
+            "found": found,
+        }
+
+    if example.get("expected_pass_awareness"):
+        details["pass_check"] = {
+            "pass": any(pw in text.full_lower for pw in PASS_WORDS),
+        }
+
     return details
 
 
 if __name__ == "__main__":
-    import dspy
     from powder.signatures import GenerateRecommendation
 
     dspy.configure(lm=dspy.LM("anthropic/claude-haiku-4-5-20251001"))
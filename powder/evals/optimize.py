@@ -13,8 +13,12 @@ Environment variables:
 """
 
 import argparse
+import functools
+import hashlib
+import inspect
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import dspy
@@ -41,6 +45,155 @@ from powder.evals import (
 DEFAULT_BASE_LM = "anthropic/claude-haiku-4-5-20251001"
 DEFAULT_REFLECTION_LM = "anthropic/claude-haiku-4-5-20251001"
 
+# Max concurrent LM calls when evaluating baseline vs optimized
+EVAL_THREADS = 8
+
+# Part of every GEPA cache key; bump when an eval metric or score_detailed
+# changes so stale results aren't reused
+GEPA_CACHE_VERSION = 1
+
+
+def _with_base_lm(optimize_fn):
+    """
+    Run an optimize_* function with the base LM scoped via dspy.context.
+
+    Scoping instead of dspy.configure lets several signatures be optimized
+    concurrently from worker threads. The LM cache is kept on so re-runs
+    don't re-pay for identical calls.
+    """
+
+    @functools.wraps(optimize_fn)
+    def wrapper(*args, **kwargs):
+        base_lm = os.environ.get("POWDER_BASE_LM", DEFAULT_BASE_LM)
+        with dspy.context(lm=dspy.LM(base_lm, cache=True)):
+            return optimize_fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _gepa_cache_path(
+    output_dir: Path,
+    name: str,
+    optimizer: GEPA,
+    student: dspy.Module,
+    trainset: list,
+    valset: list,
+    base_lm: str,
+) -> Path:
+    """
+    Path of the cached GEPA result for this exact optimization setup.
+
+    Covers the GEPA settings (every plain-valued attribute, so new kwargs are
+    picked up), the reflection LM, and the metric: its own source plus
+    GEPA_CACHE_VERSION for changes to the eval helpers it calls.
+    """
+    settings = {
+        key: value
+        for key, value in vars(optimizer).items()
+        if isinstance(value, (str, int, float, bool, type(None)))
+    }
+    payload = json.dumps(
+        {
+            "instructions": student.signature.instructions,
+            "fields": list(student.signature.fields),
+            "trainset": [ex.toDict() for ex in trainset],
+            "valset": [ex.toDict() for ex in valset],
+            "base_lm": base_lm,
+            "reflection_lm": optimizer.reflection_lm.model,
+            "reflection_lm_kwargs": optimizer.reflection_lm.kwargs,
+            "gepa": settings,
+            "metric": inspect.getsource(optimizer.metric_fn),
+            "version": GEPA_CACHE_VERSION,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return output_dir / ".gepa_cache" / f"{name}_{key}.json"
+
+
+def _gepa_val_scores(optimized: dspy.Module) -> dict | None:
+    """Seed vs best candidate val score GEPA already computed (track_stats=True)."""
+    results = getattr(optimized, "detailed_results", None)
+    if results is None:
+        return None
+    scores = results.val_aggregate_scores
+    return {"baseline": scores[0], "optimized": scores[results.best_idx]}
+
+
+def _compile_cached(
+    optimizer: GEPA,
+    student: dspy.Module,
+    trainset: list,
+    valset: list,
+    cache_path: Path,
+    use_cache: bool,
+) -> tuple[dspy.Module, dict | None]:
+    """
+    Run GEPA, or load a previous result for the same setup from disk.
+
+    Returns the optimized module and its GEPA val scores, which are cached
+    next to the module so a cache hit doesn't need to re-evaluate either.
+    """
+    scores_path = cache_path.with_suffix(".scores.json")
+
+    if use_cache and cache_path.exists():
+        print(f"Loaded cached GEPA result: {cache_path}")
+        student.load(cache_path)
+        scores = json.loads(scores_path.read_text()) if scores_path.exists() else None
+        return student, scores
+
+    optimized = optimizer.compile(
+        student,
+        trainset=trainset,
+        valset=valset,
+    )
+    cache_path.parent.mkdir(exist_ok=True)
+    optimized.save(cache_path)
+
+    scores = _gepa_val_scores(optimized)
+    if scores is not None:
+        scores_path.write_text(json.dumps(scores))
+    return optimized, scores
+
+
+def _print_comparison(
+    base_student: dspy.Module,
+    optimized: dspy.Module,
+    metric,
+    trainset: list,
+    valset: list,
+    val_scores: dict | None = None,
+):
+    """
+    Print baseline vs optimized average metric on the train and val sets.
+
+    When GEPA's own val scores are available they are reported directly,
+    saving a full val pass of LM calls; the train set is always re-run.
+    """
+    print("\n--- Evaluation ---")
+
+    for split_name, split_data in [("Train", trainset), ("Val", valset)]:
+        if split_name == "Val" and val_scores is not None:
+            base_avg = val_scores["baseline"]
+            opt_avg = val_scores["optimized"]
+            print(f"{split_name} ({len(split_data)} examples, scored during GEPA):")
+        else:
+            evaluator = dspy.Evaluate(
+                devset=split_data,
+                metric=metric,
+                num_threads=min(EVAL_THREADS, len(split_data)),
+                max_errors=len(split_data) + 1,
+            )
+            # Evaluate reports a percentage; failed calls score 0
+            base_avg = evaluator(base_student).score / 100
+            opt_avg = evaluator(optimized).score / 100
+            print(f"{split_name} ({len(split_data)} examples):")
+
+        print(f"  Baseline:  {base_avg:.1%}")
+        print(f"  Optimized: {opt_avg:.1%}")
+        print(f"  Change:    {(opt_avg - base_avg):+.1%}")
+
 
 def make_gepa_metric(base_metric, signature_name: str):
     """Wrap a base metric to return ScoreWithFeedback for GEPA."""
@@ -52,27 +205,12 @@ def make_gepa_metric(base_metric, signature_name: str):
         feedback_parts = []
 
         if signature_name == "ParseSkiQuery":
-            parsed = pred.parsed
-            # Check each field and provide specific feedback
-            if hasattr(gold, "expected_pass_type"):
-                if parsed.pass_type != gold.expected_pass_type:
+            # Per-field results from the same comparators the metric uses
+            for field, detail in parse_query.score_detailed(gold, pred).items():
+                if detail["score"] < 1.0:
                     feedback_parts.append(
-                        f"pass_type should be '{gold.expected_pass_type}' but got '{parsed.pass_type}'"
-                    )
-            if hasattr(gold, "expected_needs_terrain_parks"):
-                if parsed.needs_terrain_parks != gold.expected_needs_terrain_parks:
-                    feedback_parts.append(
-                        f"needs_terrain_parks should be {gold.expected_needs_terrain_parks}"
-                    )
-            if hasattr(gold, "expected_vibe"):
-                if parsed.vibe != gold.expected_vibe:
-                    feedback_parts.append(
-                        f"vibe should be '{gold.expected_vibe}' but got '{parsed.vibe}'"
-                    )
-            if hasattr(gold, "expected_max_drive_hours"):
-                if parsed.max_drive_hours != gold.expected_max_drive_hours:
-                    feedback_parts.append(
-                        f"max_drive_hours should be {gold.expected_max_drive_hours} but got {parsed.max_drive_hours}"
+                        f"{field} should be {detail['expected']!r} "
+                        f"but got {detail['actual']!r}"
                     )
 
         if score >= 1.0:
@@ -87,9 +225,11 @@ def make_gepa_metric(base_metric, signature_name: str):
     return gepa_metric
 
 
+@_with_base_lm
 def optimize_parse_query(
     max_calls: int = 50,
     output_dir: Path = None,
+    use_cache: bool = True,
 ):
     """Optimize ParseSkiQuery signature with GEPA."""
     print("\n" + "=" * 60)
@@ -103,9 +243,6 @@ def optimize_parse_query(
     print(f"Base LM: {base_lm}")
     print(f"Reflection LM: {reflection_lm}")
 
-    # Configure DSPy
-    dspy.configure(lm=dspy.LM(base_lm))
-
     # Get training and validation data
     trainset = parse_query.get_trainset()
     valset = parse_query.get_valset()
@@ -127,52 +264,41 @@ def optimize_parse_query(
         reflection_lm=dspy.LM(reflection_lm, temperature=1.0),
     )
 
-    optimized = optimizer.compile(
-        student,
-        trainset=trainset,
-        valset=valset,
-    )
-
-    # Save optimized module
     if output_dir is None:
         output_dir = Path(__file__).parent.parent / "optimized"
     output_dir.mkdir(exist_ok=True)
 
+    cache_path = _gepa_cache_path(
+        output_dir, "parse_query", optimizer, student, trainset, valset, base_lm
+    )
+    optimized, val_scores = _compile_cached(
+        optimizer, student, trainset, valset, cache_path, use_cache
+    )
+
+    # Save optimized module
     output_path = output_dir / "parse_query.json"
     optimized.save(output_path)
     print(f"\nSaved optimized module to: {output_path}")
 
     # Evaluate improvement on train and val sets
-    print("\n--- Evaluation ---")
     base_student = dspy.Predict(ParseSkiQuery)
-
-    for split_name, split_data in [("Train", trainset), ("Val", valset)]:
-        base_score = 0
-        opt_score = 0
-
-        for ex in split_data:
-            # Base
-            base_pred = base_student(query=ex.query, user_context=ex.user_context)
-            base_score += parse_query.parse_query_metric(ex, base_pred)
-
-            # Optimized
-            opt_pred = optimized(query=ex.query, user_context=ex.user_context)
-            opt_score += parse_query.parse_query_metric(ex, opt_pred)
-
-        base_avg = base_score / len(split_data)
-        opt_avg = opt_score / len(split_data)
-
-        print(f"{split_name} ({len(split_data)} examples):")
-        print(f"  Baseline:  {base_avg:.1%}")
-        print(f"  Optimized: {opt_avg:.1%}")
-        print(f"  Change:    {(opt_avg - base_avg):+.1%}")
+    _print_comparison(
+        base_student,
+        optimized,
+        parse_query.parse_query_metric,
+        trainset,
+        valset,
+        val_scores,
+    )
 
     return optimized
 
 
+@_with_base_lm
 def optimize_score_mountain(
     max_calls: int = 50,
     output_dir: Path = None,
+    use_cache: bool = True,
 ):
     """Optimize ScoreMountain signature with GEPA."""
     print("\n" + "=" * 60)
@@ -186,9 +312,6 @@ def optimize_score_mountain(
     print(f"Base LM: {base_lm}")
     print(f"Reflection LM: {reflection_lm}")
 
-    # Configure DSPy
-    dspy.configure(lm=dspy.LM(base_lm))
-
     # Get training and validation data
     trainset = score_mountain.get_trainset()
     valset = score_mountain.get_valset()
@@ -203,32 +326,18 @@ def optimize_score_mountain(
         base_score = score_mountain.score_mountain_metric(gold, pred, trace)
 
         feedback_parts = []
+        details = score_mountain.score_detailed(gold, pred)
         # Check score range
-        try:
-            score_val = float(pred.score)
-            if score_val < 0 or score_val > 100:
-                feedback_parts.append(f"Score {score_val} out of valid 0-100 range")
-        except (ValueError, TypeError):
-            feedback_parts.append(f"Score '{pred.score}' is not a valid number")
+        if not details["score_valid"]["valid"]:
+            feedback_parts.append(f"Score {pred.score} out of valid 0-100 range")
 
         # Check if expected score direction is correct
-        if hasattr(gold, "expected_score_above"):
-            try:
-                if float(pred.score) < gold.expected_score_above:
-                    feedback_parts.append(
-                        f"Score should be above {gold.expected_score_above} for these conditions"
-                    )
-            except (ValueError, TypeError):
-                pass
-
-        if hasattr(gold, "expected_score_below"):
-            try:
-                if float(pred.score) > gold.expected_score_below:
-                    feedback_parts.append(
-                        f"Score should be below {gold.expected_score_below} for these conditions"
-                    )
-            except (ValueError, TypeError):
-                pass
+        score_range = details.get("score_range")
+        if score_range and not score_range["in_range"]:
+            feedback_parts.append(
+                f"Score should be {score_range['expected']} for these conditions "
+                f"but got {pred.score}"
+            )
 
         if base_score >= 1.0:
             feedback = "Perfect! Score and reasoning are well-calibrated."
@@ -250,60 +359,41 @@ def optimize_score_mountain(
         reflection_lm=dspy.LM(reflection_lm, temperature=1.0),
     )
 
-    optimized = optimizer.compile(
-        student,
-        trainset=trainset,
-        valset=valset,
-    )
-
-    # Save optimized module
     if output_dir is None:
         output_dir = Path(__file__).parent.parent / "optimized"
     output_dir.mkdir(exist_ok=True)
 
+    cache_path = _gepa_cache_path(
+        output_dir, "score_mountain", optimizer, student, trainset, valset, base_lm
+    )
+    optimized, val_scores = _compile_cached(
+        optimizer, student, trainset, valset, cache_path, use_cache
+    )
+
+    # Save optimized module
     output_path = output_dir / "score_mountain.json"
     optimized.save(output_path)
     print(f"\nSaved optimized module to: {output_path}")
 
     # Evaluate improvement on train and val sets
-    print("\n--- Evaluation ---")
     base_student = dspy.Predict(ScoreMountain)
-
-    for split_name, split_data in [("Train", trainset), ("Val", valset)]:
-        base_score = 0
-        opt_score = 0
-
-        for ex in split_data:
-            # Base
-            base_pred = base_student(
-                mountain=ex.mountain,
-                user_preferences=ex.user_preferences,
-                day_context=ex.day_context,
-            )
-            base_score += score_mountain.score_mountain_metric(ex, base_pred)
-
-            # Optimized
-            opt_pred = optimized(
-                mountain=ex.mountain,
-                user_preferences=ex.user_preferences,
-                day_context=ex.day_context,
-            )
-            opt_score += score_mountain.score_mountain_metric(ex, opt_pred)
-
-        base_avg = base_score / len(split_data)
-        opt_avg = opt_score / len(split_data)
-
-        print(f"{split_name} ({len(split_data)} examples):")
-        print(f"  Baseline:  {base_avg:.1%}")
-        print(f"  Optimized: {opt_avg:.1%}")
-        print(f"  Change:    {(opt_avg - base_avg):+.1%}")
+    _print_comparison(
+        base_student,
+        optimized,
+        score_mountain.score_mountain_metric,
+        trainset,
+        valset,
+        val_scores,
+    )
 
     return optimized
 
 
+@_with_base_lm
 def optimize_assess_conditions(
     max_calls: int = 50,
     output_dir: Path = None,
+    use_cache: bool = True,
 ):
     """Optimize AssessConditions signature with GEPA."""
     print("\n" + "=" * 60)
@@ -317,9 +407,6 @@ def optimize_assess_conditions(
     print(f"Base LM: {base_lm}")
     print(f"Reflection LM: {reflection_lm}")
 
-    # Configure DSPy
-    dspy.configure(lm=dspy.LM(base_lm))
-
     # Get training and validation data
     trainset = assess_conditions.get_trainset()
     valset = assess_conditions.get_valset()
@@ -334,51 +421,35 @@ def optimize_assess_conditions(
         base_score = assess_conditions.assess_conditions_metric(gold, pred, trace)
 
         feedback_parts = []
+        day_quality = pred.day_quality.lower().strip()
+        day_context = pred.day_context.lower()
 
         # Check day_quality validity
-        valid_qualities = {"excellent", "good", "fair", "poor", "stay_home"}
-        if pred.day_quality.lower().strip() not in valid_qualities:
+        if day_quality not in assess_conditions.VALID_DAY_QUALITIES:
             feedback_parts.append(
-                f"day_quality '{pred.day_quality}' is not valid (use: {valid_qualities})"
+                f"day_quality '{pred.day_quality}' is not valid "
+                f"(use: {assess_conditions.VALID_DAY_QUALITIES})"
             )
 
         # Check expected day quality
         if hasattr(gold, "expected_day_quality"):
             expected = gold.expected_day_quality
-            if isinstance(expected, list):
-                if pred.day_quality.lower().strip() not in [
-                    e.lower() for e in expected
-                ]:
-                    feedback_parts.append(
-                        f"day_quality should be one of {expected} but got '{pred.day_quality}'"
-                    )
-            else:
-                if pred.day_quality.lower().strip() != expected.lower():
-                    feedback_parts.append(
-                        f"day_quality should be '{expected}' but got '{pred.day_quality}'"
-                    )
-
-        # Check if wind should be mentioned
-        if hasattr(gold, "expected_mention_wind") and gold.expected_mention_wind:
-            if "wind" not in pred.day_context.lower():
+            if not assess_conditions.day_quality_matches(expected, pred.day_quality):
                 feedback_parts.append(
-                    "Should mention wind in day_context for windy conditions"
+                    f"day_quality should be {expected!r} but got '{pred.day_quality}'"
                 )
 
-        # Check if cold should be mentioned
-        if hasattr(gold, "expected_mention_cold") and gold.expected_mention_cold:
-            cold_words = [
-                "cold",
-                "frigid",
-                "bitter",
-                "freezing",
-                "temperature",
-                "frostbite",
-            ]
-            if not any(w in pred.day_context.lower() for w in cold_words):
-                feedback_parts.append(
-                    "Should mention cold/temperature in day_context for bitter cold"
-                )
+        # Check if wind or cold should be mentioned
+        if gold.get("expected_mention_wind") and "wind" not in day_context:
+            feedback_parts.append(
+                "Should mention wind in day_context for windy conditions"
+            )
+        if gold.get("expected_mention_cold") and not any(
+            w in day_context for w in assess_conditions.COLD_WORDS
+        ):
+            feedback_parts.append(
+                "Should mention cold/temperature in day_context for bitter cold"
+            )
 
         if base_score >= 1.0:
             feedback = "Perfect! Day quality and context are well-calibrated."
@@ -398,58 +469,41 @@ def optimize_assess_conditions(
         reflection_lm=dspy.LM(reflection_lm, temperature=1.0),
     )
 
-    optimized = optimizer.compile(
-        student,
-        trainset=trainset,
-        valset=valset,
-    )
-
-    # Save optimized module
     if output_dir is None:
         output_dir = Path(__file__).parent.parent / "optimized"
     output_dir.mkdir(exist_ok=True)
 
+    cache_path = _gepa_cache_path(
+        output_dir, "assess_conditions", optimizer, student, trainset, valset, base_lm
+    )
+    optimized, val_scores = _compile_cached(
+        optimizer, student, trainset, valset, cache_path, use_cache
+    )
+
+    # Save optimized module
     output_path = output_dir / "assess_conditions.json"
     optimized.save(output_path)
     print(f"\nSaved optimized module to: {output_path}")
 
     # Evaluate improvement on train and val sets
-    print("\n--- Evaluation ---")
     base_student = dspy.Predict(AssessConditions)
-
-    for split_name, split_data in [("Train", trainset), ("Val", valset)]:
-        base_score = 0
-        opt_score = 0
-
-        for ex in split_data:
-            # Base
-            base_pred = base_student(
-                all_candidates=ex.all_candidates,
-                user_preferences=ex.user_preferences,
-            )
-            base_score += assess_conditions.assess_conditions_metric(ex, base_pred)
-
-            # Optimized
-            opt_pred = optimized(
-                all_candidates=ex.all_candidates,
-                user_preferences=ex.user_preferences,
-            )
-            opt_score += assess_conditions.assess_conditions_metric(ex, opt_pred)
-
-        base_avg = base_score / len(split_data)
-        opt_avg = opt_score / len(split_data)
-
-        print(f"{split_name} ({len(split_data)} examples):")
-        print(f"  Baseline:  {base_avg:.1%}")
-        print(f"  Optimized: {opt_avg:.1%}")
-        print(f"  Change:    {(opt_avg - base_avg):+.1%}")
+    _print_comparison(
+        base_student,
+        optimized,
+        assess_conditions.assess_conditions_metric,
+        trainset,
+        valset,
+        val_scores,
+    )
 
     return optimized
 
 
+@_with_base_lm
 def optimize_generate_recommendation(
     max_calls: int = 50,
     output_dir: Path = None,
+    use_cache: bool = True,
 ):
     """Optimize GenerateRecommendation signature with GEPA."""
     print("\n" + "=" * 60)
@@ -463,9 +517,6 @@ def optimize_generate_recommendation(
     print(f"Base LM: {base_lm}")
     print(f"Reflection LM: {reflection_lm}")
 
-    # Configure DSPy
-    dspy.configure(lm=dspy.LM(base_lm))
-
     # Get training and validation data
     trainset = generate_recommendation.get_trainset()
     valset = generate_recommendation.get_valset()
@@ -482,42 +533,34 @@ def optimize_generate_recommendation(
         )
 
         feedback_parts = []
+        details = generate_recommendation.score_detailed(gold, pred)
 
         # Check top pick correctness
-        if hasattr(gold, "expected_top_pick"):
-            acceptable = gold.expected_top_pick
-            top_pick_lower = pred.top_pick.lower()
-            if not any(mtn.lower() in top_pick_lower for mtn in acceptable):
-                feedback_parts.append(
-                    f"top_pick should mention one of {acceptable} but got '{pred.top_pick[:50]}...'"
-                )
+        top_pick = details.get("top_pick_check")
+        if top_pick and not top_pick["pass"]:
+            feedback_parts.append(
+                f"top_pick should mention one of {top_pick['expected_any']} "
+                f"but got '{pred.top_pick[:50]}...'"
+            )
 
         # Check alternatives grounding
-        if hasattr(gold, "expected_alternatives_mention"):
-            expected_mtns = gold.expected_alternatives_mention
-            alts_lower = pred.alternatives.lower()
-            missing = [mtn for mtn in expected_mtns if mtn.lower() not in alts_lower]
-            if missing:
-                feedback_parts.append(f"alternatives should mention {missing}")
+        alternatives = details.get("alternatives_check")
+        if alternatives and not alternatives["found"]:
+            feedback_parts.append(
+                f"alternatives should mention one of {alternatives['expected_any']}"
+            )
 
         # Check caveat keywords
-        if hasattr(gold, "expected_caveat_keywords"):
-            keywords = gold.expected_caveat_keywords
-            full_text = (
-                pred.caveat + " " + pred.top_pick + " " + pred.alternatives
-            ).lower()
-            missing = [kw for kw in keywords if kw.lower() not in full_text]
-            if missing:
-                feedback_parts.append(f"should mention concerns like {missing}")
+        caveat = details.get("caveat_check")
+        if caveat and not caveat["found"]:
+            feedback_parts.append(
+                f"should mention concerns like {caveat['expected_any']}"
+            )
 
         # Check pass awareness
-        if hasattr(gold, "expected_pass_awareness") and gold.expected_pass_awareness:
-            full_text = (
-                pred.top_pick + " " + pred.alternatives + " " + pred.caveat
-            ).lower()
-            pass_words = ["pass", "ikon", "epic", "indy", "ticket"]
-            if not any(pw in full_text for pw in pass_words):
-                feedback_parts.append("should mention pass type compatibility")
+        pass_check = details.get("pass_check")
+        if pass_check and not pass_check["pass"]:
+            feedback_parts.append("should mention pass type compatibility")
 
         if base_score >= 1.0:
             feedback = (
@@ -541,59 +584,38 @@ def optimize_generate_recommendation(
         reflection_lm=dspy.LM(reflection_lm, temperature=1.0),
     )
 
-    optimized = optimizer.compile(
-        student,
-        trainset=trainset,
-        valset=valset,
-    )
-
-    # Save optimized module
     if output_dir is None:
         output_dir = Path(__file__).parent.parent / "optimized"
     output_dir.mkdir(exist_ok=True)
 
+    cache_path = _gepa_cache_path(
+        output_dir,
+        "generate_recommendation",
+        optimizer,
+        student,
+        trainset,
+        valset,
+        base_lm,
+    )
+    optimized, val_scores = _compile_cached(
+        optimizer, student, trainset, valset, cache_path, use_cache
+    )
+
+    # Save optimized module
     output_path = output_dir / "generate_recommendation.json"
     optimized.save(output_path)
     print(f"\nSaved optimized module to: {output_path}")
 
     # Evaluate improvement on train and val sets
-    print("\n--- Evaluation ---")
     base_student = dspy.Predict(GenerateRecommendation)
-
-    for split_name, split_data in [("Train", trainset), ("Val", valset)]:
-        base_score = 0
-        opt_score = 0
-
-        for ex in split_data:
-            # Base
-            base_pred = base_student(
-                query=ex.query,
-                day_assessment=ex.day_assessment,
-                scored_candidates=ex.scored_candidates,
-                crowd_context=ex.crowd_context,
-            )
-            base_score += generate_recommendation.generate_recommendation_metric(
-                ex, base_pred
-            )
-
-            # Optimized
-            opt_pred = optimized(
-                query=ex.query,
-                day_assessment=ex.day_assessment,
-                scored_candidates=ex.scored_candidates,
-                crowd_context=ex.crowd_context,
-            )
-            opt_score += generate_recommendation.generate_recommendation_metric(
-                ex, opt_pred
-            )
-
-        base_avg = base_score / len(split_data)
-        opt_avg = opt_score / len(split_data)
-
-        print(f"{split_name} ({len(split_data)} examples):")
-        print(f"  Baseline:  {base_avg:.1%}")
-        print(f"  Optimized: {opt_avg:.1%}")
-        print(f"  Change:    {(opt_avg - base_avg):+.1%}")
+    _print_comparison(
+        base_student,
+        optimized,
+        generate_recommendation.generate_recommendation_metric,
+        trainset,
+        valset,
+        val_scores,
+    )
 
     return optimized
 
@@ -624,6 +646,11 @@ def main():
         type=Path,
         help="Output directory for optimized modules",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run GEPA even if a cached result exists for the same setup",
+    )
 
     args = parser.parse_args()
 
@@ -631,40 +658,36 @@ def main():
         print("Error: ANTHROPIC_API_KEY environment variable not set")
         return
 
-    if args.signature in ("parse_query", "all"):
-        optimize_parse_query(
-            max_calls=args.max_calls,
-            output_dir=args.output_dir,
-        )
-
-    if args.signature in ("score_mountain", "all"):
-        optimize_score_mountain(
-            max_calls=args.max_calls,
-            output_dir=args.output_dir,
-        )
-
-    if args.signature in ("assess_conditions", "all"):
-        optimize_assess_conditions(
-            max_calls=args.max_calls,
-            output_dir=args.output_dir,
-        )
-
-    if args.signature in ("generate_recommendation", "all"):
-        optimize_generate_recommendation(
-            max_calls=args.max_calls,
-            output_dir=args.output_dir,
-        )
+    optimize_fns = {
+        "parse_query": optimize_parse_query,
+        "score_mountain": optimize_score_mountain,
+        "assess_conditions": optimize_assess_conditions,
+        "generate_recommendation": optimize_generate_recommendation,
+    }
+    kwargs = {
+        "max_calls": args.max_calls,
+        "output_dir": args.output_dir,
+        "use_cache": not args.no_cache,
+    }
+
+    if args.signature == "all":
+        # LM-bound and independent, so overlap them (output will interleave)
+        with ThreadPoolExecutor(max_workers=len(optimize_fns)) as executor:
+            futures = [executor.submit(fn, **kwargs) for fn in optimize_fns.values()]
+            for future in as_completed(futures):
+                future.result()
+    elif args.signature in optimize_fns:
+        optimize_fns[args.signature](**kwargs)
 
     if args.signature == "react":
-        optimize_react(
-            max_calls=args.max_calls,
-            output_dir=args.output_dir,
-        )
+        optimize_react(**kwargs)
 
 
+@_with_base_lm
 def optimize_react(
     max_calls: int = 30,
     output_dir: Path = None,
+    use_cache: bool = True,
 ):
     """
     Optimize ReAct agent's SkiRecommendation signature with GEPA.
@@ -683,9 +706,6 @@ def optimize_react(
     print(f"Reflection LM: {reflection_lm}")
     print("WARNING: This is slow - each eval runs full ReAct with tool calls")
 
-    # Configure DSPy
-    dspy.configure(lm=dspy.LM(base_lm))
-
     # Import agent tools
     from powder.agent import (
         search_mountains,
@@ -757,59 +777,33 @@ def optimize_react(
         enable_tool_optimization=True,  # Enable tool usage optimization for ReAct
     )
 
-    optimized = optimizer.compile(
-        student,
-        trainset=trainset,
-        valset=valset,
-    )
-
-    # Save optimized module
     if output_dir is None:
         output_dir = Path(__file__).parent.parent / "optimized"
     output_dir.mkdir(exist_ok=True)
 
+    cache_path = _gepa_cache_path(
+        output_dir, "react_agent", optimizer, student, trainset, valset, base_lm
+    )
+    optimized, val_scores = _compile_cached(
+        optimizer, student, trainset, valset, cache_path, use_cache
+    )
+
+    # Save optimized module
     output_path = output_dir / "react_agent.json"
     optimized.save(output_path)
     print(f"\nSaved optimized module to: {output_path}")
 
     # Evaluate improvement on train and val sets
-    print("\n--- Evaluation ---")
     base_student = dspy.ReAct(signature=SkiRecommendation, tools=tools, max_iters=8)
 
-    for split_name, split_data in [("Train", trainset), ("Val", valset)]:
-        base_score = 0
-        opt_score = 0
-
-        for ex in split_data:
-            # Base
-            try:
-                base_pred = base_student(query=ex.query, user_context=ex.user_context)
-                base_hit = any(
-                    mtn.lower() in base_pred.recommendation.lower()
-                    for mtn in ex._expected_top_pick
-                )
-                base_score += 1.0 if base_hit else 0.0
-            except Exception as e:
-                print(f"Base error: {e}")
-
-            # Optimized
-            try:
-                opt_pred = optimized(query=ex.query, user_context=ex.user_context)
-                opt_hit = any(
-                    mtn.lower() in opt_pred.recommendation.lower()
-                    for mtn in ex._expected_top_pick
-                )
-                opt_score += 1.0 if opt_hit else 0.0
-            except Exception as e:
-                print(f"Optimized error: {e}")
-
-        base_avg = base_score / len(split_data)
-        opt_avg = opt_score / len(split_data)
+    def react_hit(ex, pred):
+        recommendation = pred.recommendation.lower()
+        hit = any(mtn.lower() in recommendation for mtn in ex._expected_top_pick)
+        return 1.0 if hit else 0.0
 
-        print(f"{split_name} ({len(split_data)} examples):")
-        print(f"  Baseline:  {base_avg:.1%}")
-        print(f"  Optimized: {opt_avg:.1%}")
-        print(f"  Change:    {(opt_avg - base_avg):+.1%}")
+    _print_comparison(
+        base_student, optimized, react_hit, trainset, valset, val_scores
+    )
 
     return optimized
 
@@ -15,17 +15,139 @@ import dspy
 from datetime import date
 
 
+BOOL_FIELDS = (
+    "needs_terrain_parks",
+    "needs_glades",
+    "needs_beginner_terrain",
+    "needs_expert_terrain",
+    "needs_night_skiing",
+)
+ENUM_FIELDS = ("pass_type", "skill_level", "activity", "vibe")
+
+# Enum values compare case-insensitively, ignoring "_" and "-"
+_NORM = str.maketrans("", "", "_-")
+
+
+def _norm(value: str) -> str:
+    return value.lower().translate(_NORM)
+
+
+# --- Field comparators: (expected comparison value, actual) -> score ---
+
+
+def _cmp_bool(expected, actual) -> float:
+    # Pydantic handles bool coercion, but just in case
+    if isinstance(actual, str):
+        actual = actual.lower() == "true"
+    return 1.0 if actual == expected else 0.0
+
+
+def _cmp_enum(expected, actual) -> float:
+    # expected is already normalized (or None)
+    if expected is None:
+        # Pydantic gives us None directly, not "null" string
+        return 1.0 if actual is None else 0.0
+    if actual is None:
+        return 0.0
+    return 1.0 if expected == _norm(str(actual)) else 0.0
+
+
+def _cmp_num(expected, actual) -> float:
+    if actual is None:
+        return 0.0
+    try:
+        diff = abs(float(actual) - expected)
+    except (ValueError, TypeError):
+        return 0.0
+    return 1.0 if diff < 0.1 else 0.5 if diff < 0.5 else 0.0
+
+
+# Relative dates and what they resolve to in BOSTON_CONTEXT
+_DATE_EQUIV = {
+    "today": frozenset({"today", "2025-01-15"}),
+    "tomorrow": frozenset({"tomorrow", "2025-01-16"}),
+}
+
+
+def _cmp_date(expected, actual) -> float:
+    # expected is already lowercased and stripped
+    if actual is None:
+        return 0.0
+    actual_str = str(actual).lower().strip()
+    # Direct match, or a relative date resolved against the context
+    if actual_str == expected or actual_str in _DATE_EQUIV.get(expected, ()):
+        return 1.0
+    return 0.0
+
+
+_COMPARATORS = {
+    "bool": _cmp_bool,
+    "enum": _cmp_enum,
+    "num": _cmp_num,
+    "date": _cmp_date,
+}
+
+# (ParsedQuery field, comparator kind); expected value lives in expected_<field>
+FIELD_SPEC = (
+    *((field, "bool") for field in BOOL_FIELDS),
+    *((field, "enum") for field in ENUM_FIELDS),
+    ("max_drive_hours", "num"),
+    ("target_date", "date"),
+)
+
+
+def _comparison_values(exp_map: dict) -> dict:
+    """Expected value per field, pre-normalized for its comparator."""
+    values = {}
+    for field, kind in FIELD_SPEC:
+        key = f"expected_{field}"
+        if key not in exp_map:
+            continue
+        value = exp_map[key]
+        if kind == "enum" and isinstance(value, str):
+            value = _norm(value)
+        elif kind == "date":
+            value = str(value).lower().strip()
+        values[field] = value
+    return values
+
+
 def make_example(
     query: str,
     user_context: str,
     expected: dict,
 ) -> dspy.Example:
-    """Create a ParseSkiQuery evaluation example."""
-    return dspy.Example(
+    """Create a ParseSkiQuery evaluation example.
+
+    The expected_* values are also stashed as a plain dict on
+    example._expected_map, and their comparator-ready forms on
+    example._expected_cmp, so the metric does dict lookups instead of
+    attribute probes through dspy.Example.
+    """
+    example = dspy.Example(
         query=query,
         user_context=user_context,
         **expected,
     ).with_inputs("query", "user_context")
+    example._expected_map = dict(expected)
+    example._expected_cmp = _comparison_values(expected)
+    return example
+
+
+def _expected_map(example: dspy.Example) -> dict:
+    """expected_* values of example, built on the fly for copied/ad-hoc examples."""
+    exp_map = getattr(example, "_expected_map", None)
+    if exp_map is None:
+        exp_map = {k: v for k, v in example.items() if k.startswith("expected_")}
+    return exp_map
+
+
+def _expected_cmp(example: dspy.Example) -> dict:
+    """Comparator-ready expectations, built on the fly if make_example didn't."""
+    exp_cmp = getattr(example, "_expected_cmp", None)
+    if exp_cmp is None:
+        exp_cmp = _comparison_values(_expected_map(example))
+    return exp_cmp
 
 
 # --- Standard user context (Boston, mid-January) ---
@@ -245,97 +367,19 @@ def parse_query_metric(
     Returns:
         Float between 0 and 1 (average of all applicable checks)
     """
-    scores = []
+    exp_cmp = _expected_cmp(example)
 
     # Access the ParsedQuery Pydantic model
     parsed = pred.parsed
 
-    # --- Boolean field checks (exact match) ---
-    bool_fields = [
-        "needs_terrain_parks",
-        "needs_glades",
-        "needs_beginner_terrain",
-        "needs_expert_terrain",
-        "needs_night_skiing",
-    ]
-
-    for field in bool_fields:
-        expected_key = f"expected_{field}"
-        if hasattr(example, expected_key):
-            expected = getattr(example, expected_key)
-            actual = getattr(parsed, field, None)
-            # Pydantic handles bool coercion, but just in case
-            if isinstance(actual, str):
-                actual = actual.lower() == "true"
-            scores.append(1.0 if actual == expected else 0.0)
-
-    # --- Enum field checks (exact match, case-insensitive) ---
-    enum_fields = ["pass_type", "skill_level", "activity", "vibe"]
-
-    for field in enum_fields:
-        expected_key = f"expected_{field}"
-        if hasattr(example, expected_key):
-            expected = getattr(example, expected_key)
-            actual = getattr(parsed, field, None)
+    total = 0.0
+    count = 0
+    for field, kind in FIELD_SPEC:
+        if field in exp_cmp:
+            total += _COMPARATORS[kind](exp_cmp[field], getattr(parsed, field, None))
+            count += 1
 
-            if expected is None:
-                # Pydantic gives us None directly, not "null" string
-                scores.append(1.0 if actual is None else 0.0)
-            elif actual is None:
-                scores.append(0.0)
-            else:
-                # Case-insensitive match, handle underscore variants
-                expected_norm = expected.lower().replace("_", "").replace("-", "")
-                actual_norm = str(actual).lower().replace("_", "").replace("-", "")
-                scores.append(1.0 if expected_norm == actual_norm else 0.0)
-
-    # --- Numeric field checks (with tolerance) ---
-    if hasattr(example, "expected_max_drive_hours"):
-        expected = example.expected_max_drive_hours
-        actual = parsed.max_drive_hours
-
-        if actual is None:
-            scores.append(0.0)
-        else:
-            try:
-                actual = float(actual)
-                diff = abs(actual - expected)
-                if diff < 0.1:
-                    scores.append(1.0)
-                elif diff < 0.5:
-                    scores.append(0.5)
-                else:
-                    scores.append(0.0)
-            except (ValueError, TypeError):
-                scores.append(0.0)
-
-    # --- Date field checks ---
-    if hasattr(example, "expected_target_date"):
-        expected = example.expected_target_date
-        actual = parsed.target_date
-
-        if actual is None:
-            scores.append(0.0)
-        else:
-            actual_str = str(actual).lower().strip()
-            expected_str = str(expected).lower().strip()
-
-            # Direct match
-            if actual_str == expected_str:
-                scores.append(1.0)
-            # "today" should resolve to current date in context
-            elif expected_str == "today" and actual_str in ["today", "2025-01-15"]:
-                scores.append(1.0)
-            # "tomorrow" should resolve correctly
-            elif expected_str == "tomorrow" and actual_str in [
-                "tomorrow",
-                "2025-01-16",
-            ]:
-                scores.append(1.0)
-            else:
-                scores.append(0.0)
-
-    return sum(scores) / len(scores) if scores else 0.0
+    return total / count if count else 0.0
 
 
 def get_examples() -> list[dspy.Example]:
@@ -368,74 +412,24 @@ def score_detailed(example: dspy.Example, pred: dspy.Prediction) -> dict:
     Returns dict with each field's score and values.
     """
     details = {}
+    exp_map = _expected_map(example)
+    exp_cmp = _expected_cmp(example)
     parsed = pred.parsed
 
-    # Boolean fields
-    bool_fields = [
-        "needs_terrain_parks",
-        "needs_glades",
-        "needs_beginner_terrain",
-        "needs_expert_terrain",
-        "needs_night_skiing",
-    ]
-
-    for field in bool_fields:
-        expected_key = f"expected_{field}"
-        if hasattr(example, expected_key):
-            expected = getattr(example, expected_key)
+    for field, kind in FIELD_SPEC:
+        if field in exp_cmp:
             actual = getattr(parsed, field, None)
-            if isinstance(actual, str):
-                actual = actual.lower() == "true"
             details[field] = {
-                "expected": expected,
+                "expected": exp_map[f"expected_{field}"],
                 "actual": actual,
-                "score": 1.0 if actual == expected else 0.0,
+                "score": _COMPARATORS[kind](exp_cmp[field], actual),
             }
 
-    # Enum fields
-    enum_fields = ["pass_type", "skill_level", "activity", "vibe"]
-
-    for field in enum_fields:
-        expected_key = f"expected_{field}"
-        if hasattr(example, expected_key):
-            expected = getattr(example, expected_key)
-            actual = getattr(parsed, field, None)
-            match = False
-            if expected is None and actual is None:
-                match = True
-            elif expected and actual:
-                expected_norm = expected.lower().replace("_", "")
-                actual_norm = str(actual).lower().replace("_", "")
-                match = expected_norm == actual_norm
-            details[field] = {
-                "expected": expected,
-                "actual": actual,
-                "score": 1.0 if match else 0.0,
-            }
-
-    # Numeric
-    if hasattr(example, "expected_max_drive_hours"):
-        expected = example.expected_max_drive_hours
-        actual = parsed.max_drive_hours
-        try:
-            actual_f = float(actual) if actual else None
-            diff = abs(actual_f - expected) if actual_f else 999
-            score = 1.0 if diff < 0.1 else 0.5 if diff < 0.5 else 0.0
-        except (ValueError, TypeError):
-            actual_f = None
-            score = 0.0
-        details["max_drive_hours"] = {
-            "expected": expected,
-            "actual": actual_f,
-            "score": score,
-        }
-
     return details
 
 
 if __name__ == "__main__":
     # Quick test
-    import dspy
     from powder.signatures import ParseSkiQuery
 
     dspy.configure(lm=dspy.LM("anthropic/claude-haiku-4-5-20251001"))
@@ -10,10 +10,15 @@ Or via make:
 
 import json
 import sys
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 import dspy
+import orjson
 
 from powder.evals import (
     parse_query,
@@ -32,13 +37,6 @@ from powder.evals.end_to_end import (
     calculate_reasoning_keywords,
     compute_aggregate_metrics,
 )
-from powder.evals.backtest import (
-    mock_weather_api,
-    mock_routing_api,
-    run_react_with_mocks,
-    load_fixture,
-)
-from powder.pipeline import SkiPipeline
 from powder.signatures import (
     ParseSkiQuery,
     AssessConditions,
@@ -46,9 +44,43 @@ from powder.signatures import (
     GenerateRecommendation,
 )
 
+# Concurrent LM calls per eval; every example is independent and network-bound
+EVAL_WORKERS = 8
+
+# Seconds before a single LM request is abandoned (and retried), so one hung
+# provider call can't stall a whole eval run
+LM_TIMEOUT_S = 60
+
+# Signature evals run side by side, each with its own pool; this caps the
+# LM calls in flight across all of them to stay under provider rate limits
+MAX_CONCURRENT_LM_CALLS = 16
+_LM_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_LM_CALLS)
+
+# Longest wait for an LM slot or an end-to-end example's result; past it the
+# example is recorded as an error so the run still finishes
+EXAMPLE_TIMEOUT_S = 300
+
+DEFAULT_RESULTS_PATH = Path(__file__).parent.parent.parent / "eval_results.json"
+
+# Concurrent evals share one results log handle; whole lines are written
+# under this lock so records never interleave
+_LOG_LOCK = threading.Lock()
+
 
+@lru_cache(maxsize=8)
+def _get_lm(model: str, cache: bool = True) -> dspy.LM:
+    """One LM (and HTTP client) per model across repeated run_all_evals calls."""
+    return dspy.LM(model, timeout=LM_TIMEOUT_S, cache=cache)
+
+
+@lru_cache(maxsize=None)
 def load_optimized_predictor(signature_class, optimized_name: str) -> dspy.Predict:
-    """Load optimized predictor if available, otherwise return base predictor."""
+    """
+    Load optimized predictor if available, otherwise return base predictor.
+
+    Built once per signature and shared across run_all_evals calls and eval
+    threads; predictors are only called, never mutated, during evaluation.
+    """
     optimized_path = Path(__file__).parent.parent / "optimized" / f"{optimized_name}.json"
     predictor = dspy.Predict(signature_class)
     if optimized_path.exists():
@@ -56,51 +88,115 @@ def load_optimized_predictor(signature_class, optimized_name: str) -> dspy.Predi
     return predictor
 
 
+def _error_result(example_id: str, error: Exception) -> EvalResult:
+    """EvalResult for an example whose run raised."""
+    return EvalResult(
+        example_id=example_id,
+        hit_at_1=False,
+        hit_at_3=False,
+        constraint_satisfaction={},
+        exclusion_check=False,
+        reasoning_score=0.0,
+        predicted_top_pick=f"ERROR: {error}",
+        predicted_top_3=[],
+    )
+
+
+def _result_detail(result: EvalResult) -> dict:
+    """Per-example summary kept in results files and the JSONL log."""
+    return {
+        "id": result.example_id,
+        "hit_at_1": result.hit_at_1,
+        "hit_at_3": result.hit_at_3,
+        "constraints": result.constraint_satisfaction,
+        "predicted": result.predicted_top_pick[:50],
+    }
+
+
+def _write_log(results_log: TextIO | None, record: dict):
+    """Append one JSON line to the shared results log, if there is one."""
+    if results_log is not None:
+        line = json.dumps(record) + "\n"
+        with _LOG_LOCK:
+            results_log.write(line)
+            results_log.flush()
+
+
+def _log_result(results_log: TextIO | None, eval_name: str, result: EvalResult):
+    """Append one end-to-end result to the JSONL log, if there is one."""
+    _write_log(results_log, {"eval": eval_name, **_result_detail(result)})
+
+
 def run_signature_eval(
     name: str,
     examples: list,
     predictor: dspy.Module,
     metric_fn: callable,
     verbose: bool = False,
+    results_log: TextIO | None = None,
 ) -> dict:
     """
     Run evaluation for a single signature.
 
+    If results_log is given, one JSON line per example is written to it as
+    soon as that example finishes, so a crashed run keeps what it scored.
+
     Returns dict with scores and details.
     """
-    print(f"\n{'=' * 60}")
-    print(f"Evaluating: {name}")
-    print(f"{'=' * 60}")
+    def run_example(example):
+        inputs = example.inputs().toDict()
+        try:
+            if not _LM_SLOTS.acquire(timeout=EXAMPLE_TIMEOUT_S):
+                raise TimeoutError(f"no LM slot free after {EXAMPLE_TIMEOUT_S}s")
+            try:
+                pred = predictor(**inputs)
+            finally:
+                _LM_SLOTS.release()
+            return inputs, metric_fn(example, pred), None
+        except Exception as e:
+            return inputs, 0.0, e
+
+    outcomes = [None] * len(examples)
+
+    with ThreadPoolExecutor(max_workers=EVAL_WORKERS) as executor:
+        futures = {executor.submit(run_example, ex): i for i, ex in enumerate(examples)}
+        for future in as_completed(futures):
+            i = futures[future]
+            outcomes[i] = future.result()
+            _, score, error = outcomes[i]
+            _write_log(
+                results_log,
+                {
+                    "signature": name,
+                    "example": i + 1,
+                    "score": score,
+                    "error": str(error) if error is not None else None,
+                },
+            )
 
     scores = []
     failures = []
 
-    for i, example in enumerate(examples):
-        try:
-            # Get input field names from example
-            input_fields = example.inputs().keys()
-            inputs = {k: getattr(example, k) for k in input_fields}
-
-            pred = predictor(**inputs)
-            score = metric_fn(example, pred)
-            scores.append(score)
-
-            if verbose or score < 0.8:
-                status = "✓" if score >= 0.8 else "✗"
-                print(f"  [{status}] Example {i + 1}: {score:.2f}")
-                if score < 0.8:
-                    # Show what went wrong
-                    print(f"      Query/Input: {str(inputs)[:80]}...")
-
-        except Exception as e:
-            scores.append(0.0)
-            failures.append({"example": i + 1, "error": str(e)})
-            print(f"  [!] Example {i + 1}: ERROR - {e}")
+    # Report in example order once all calls are back. Lines are printed as
+    # one block so concurrent signature evals don't interleave.
+    lines = ["", "=" * 60, f"Evaluating: {name}", "=" * 60]
+    for i, (inputs, score, error) in enumerate(outcomes):
+        scores.append(score)
+
+        if error is not None:
+            failures.append({"example": i + 1, "error": str(error)})
+            lines.append(f"  [!] Example {i + 1}: ERROR - {error}")
+        elif verbose or score < 0.8:
+            status = "✓" if score >= 0.8 else "✗"
+            lines.append(f"  [{status}] Example {i + 1}: {score:.2f}")
+            if score < 0.8:
+                # Show what went wrong
+                lines.append(f"      Query/Input: {str(inputs)[:80]}...")
 
     avg_score = sum(scores) / len(scores) if scores else 0.0
-    print(
-        f"\n  Average: {avg_score:.1%} ({sum(1 for s in scores if s >= 0.8)}/{len(scores)} passed)"
-    )
+    passed = sum(1 for s in scores if s >= 0.8)
+    lines.append(f"\n  Average: {avg_score:.1%} ({passed}/{len(scores)} passed)")
+    print("\n".join(lines))
 
     return {
         "name": name,
@@ -108,35 +204,53 @@ def run_signature_eval(
         "scores": scores,
         "failures": failures,
         "total": len(examples),
-        "passed": sum(1 for s in scores if s >= 0.8),
+        "passed": passed,
     }
 
 
 def run_end_to_end_eval(
     examples: list[EndToEndExample],
     verbose: bool = False,
+    results_log: TextIO | None = None,
 ) -> dict:
     """
     Run end-to-end pipeline evaluation.
 
-    This tests the full SkiPipeline against labeled examples.
+    This tests the full SkiPipeline against labeled examples. If results_log
+    is given, each example's result is appended to it as soon as it is scored.
     """
+    # Imported here so signature-only runs never load the pipeline and its tools
+    from powder.evals.backtest import (
+        load_fixture,
+        mock_routing_api,
+        mock_weather_api_by_context,
+        use_conditions,
+    )
+    from powder.pipeline import SkiPipeline
+
     print(f"\n{'=' * 60}")
     print("Evaluating: End-to-End Pipeline")
     print(f"{'=' * 60}")
 
     pipeline = SkiPipeline()
-    results = []
-
-    for example in examples:
-        print(f"\n  [{example.id}] {example.query[:50]}...")
 
+    # Load each date's conditions fixture once; examples only read them
+    fixtures = {}
+    for query_date in {example.query_date for example in examples}:
         try:
-            # Load conditions from fixtures by date
-            conditions = load_fixture(example.query_date.isoformat())
+            fixtures[query_date] = load_fixture(query_date.isoformat())
+        except Exception as e:
+            fixtures[query_date] = e
+
+    def run_example(example: EndToEndExample) -> EvalResult:
+        conditions = fixtures[example.query_date]
+        if isinstance(conditions, Exception):
+            return _error_result(example.id, conditions)
 
-            # Run pipeline with mocked APIs for reproducibility
-            with mock_weather_api(conditions), mock_routing_api():
+        try:
+            # Run pipeline against this example's fixture (APIs are mocked
+            # by the caller)
+            with use_conditions(conditions):
                 result = pipeline(
                     query=example.query,
                     current_date=example.query_date,
@@ -167,7 +281,7 @@ def run_end_to_end_eval(
             full_text = f"{top_pick} {result.alternatives} {result.caveat}"
             reasoning = calculate_reasoning_keywords(example, full_text)
 
-            eval_result = EvalResult(
+            return EvalResult(
                 example_id=example.id,
                 hit_at_1=hit_1,
                 hit_at_3=hit_3,
@@ -177,41 +291,59 @@ def run_end_to_end_eval(
                 predicted_top_pick=top_pick[:100] if top_pick else "",
                 predicted_top_3=top_3,
             )
-            results.append(eval_result)
 
-            # Print result
-            status = "✓" if hit_1 else "✗"
-            constraint_str = (
-                f"{sum(constraints.values())}/{len(constraints)}"
-                if constraints
-                else "N/A"
-            )
-            print(
-                f"    Hit@1: {status} | Hit@3: {'✓' if hit_3 else '✗'} | "
-                f"Constraints: {constraint_str}"
-            )
+        except Exception as e:
+            return _error_result(example.id, e)
+
+    results = [None] * len(examples)
+    executor = ThreadPoolExecutor(max_workers=EVAL_WORKERS)
+    timed_out = False
+    # APIs are patched once for the whole run and each example selects its own
+    # fixture, so examples from every query date run concurrently
+    with mock_routing_api(), mock_weather_api_by_context():
+        try:
+            futures = [executor.submit(run_example, ex) for ex in examples]
+            for i, (example, future) in enumerate(zip(examples, futures)):
+                try:
+                    results[i] = future.result(timeout=EXAMPLE_TIMEOUT_S)
+                except TimeoutError:
+                    timed_out = True
+                    results[i] = _error_result(
+                        example.id,
+                        TimeoutError(f"no result after {EXAMPLE_TIMEOUT_S}s"),
+                    )
+                _log_result(results_log, "End-to-End Pipeline", results[i])
+        finally:
+            # A worker thread can't be cancelled; don't wait on a hung one
+            executor.shutdown(wait=not timed_out)
+
+    # Report in example order
+    for example, eval_result in zip(examples, results):
+        print(f"\n  [{example.id}] {example.query[:50]}...")
 
-            if verbose or not hit_1:
-                print(f"    Predicted: {top_pick[:60]}...")
-                print(f"    Expected: {example.expected_top_pick}")
-                if constraints and not all(constraints.values()):
-                    failed = [k for k, v in constraints.items() if not v]
-                    print(f"    Failed constraints: {failed}")
+        if eval_result.predicted_top_pick.startswith("ERROR: "):
+            print(f"    {eval_result.predicted_top_pick}")
+            continue
+
+        constraints = eval_result.constraint_satisfaction
+        status = "✓" if eval_result.hit_at_1 else "✗"
+        status_3 = "✓" if eval_result.hit_at_3 else "✗"
+        constraint_str = (
+            f"{sum(constraints.values())}/{len(constraints)}"
+            if constraints
+            else "N/A"
+        )
+        print(
+            f"    Hit@1: {status} | Hit@3: {status_3} | "
+            f"Constraints: {constraint_str}"
+        )
 
-        except Exception as e:
-            print(f"    ERROR: {e}")
-            results.append(
-                EvalResult(
-                    example_id=example.id,
-                    hit_at_1=False,
-                    hit_at_3=False,
-                    constraint_satisfaction={},
-                    exclusion_check=False,
-                    reasoning_score=0.0,
-                    predicted_top_pick=f"ERROR: {e}",
-                    predicted_top_3=[],
-                )
-            )
+        if verbose or not eval_result.hit_at_1:
+            print(f"    Predicted: {eval_result.predicted_top_pick[:60]}...")
+            print(f"    Expected: {example.expected_top_pick}")
+            if constraints and not all(constraints.values()):
+                failed = [k for k, v in constraints.items() if not v]
+                print(f"    Failed constraints: {failed}")
 
     # Compute aggregates
     metrics = compute_aggregate_metrics(results)
@@ -221,30 +353,26 @@ def run_end_to_end_eval(
     return {
         "name": "End-to-End Pipeline",
         "metrics": metrics.to_dict(),
-        "detailed_results": [
-            {
-                "id": r.example_id,
-                "hit_at_1": r.hit_at_1,
-                "hit_at_3": r.hit_at_3,
-                "constraints": r.constraint_satisfaction,
-                "predicted": r.predicted_top_pick[:50],
-            }
-            for r in results
-        ],
+        "detailed_results": [_result_detail(r) for r in results],
     }
 
 
 def run_react_eval(
     examples: list[EndToEndExample],
     verbose: bool = False,
+    results_log: TextIO | None = None,
 ) -> dict:
     """
     Run end-to-end ReAct agent evaluation.
 
     This tests the ReAct agent against the same labeled examples as Pipeline.
     Note: ReAct returns unstructured text, so Hit@1/Hit@3 checks for mountain
-    name mentions in the recommendation string.
+    name mentions in the recommendation string. If results_log is given,
+    each example's result is appended to it as soon as it is scored.
     """
+    # Imported here so signature-only runs never load the agent and its tools
+    from powder.evals.backtest import load_fixture, run_react_with_mocks
+
     print(f"\n{'=' * 60}")
     print("Evaluating: End-to-End ReAct Agent")
     print(f"{'=' * 60}")
@@ -274,9 +402,10 @@ def run_react_eval(
 
             # For Hit@3, check if any expected mountains are mentioned
             # (ReAct doesn't give us an ordered list, so we check mentions)
+            recommendation_lower = recommendation.lower()
             hit_3 = (
                 any(
-                    mtn.lower() in recommendation.lower()
+                    mtn.lower() in recommendation_lower
                     for mtn in example.expected_in_top_3
                 )
                 if example.expected_in_top_3
@@ -336,6 +465,8 @@ def run_react_eval(
                 )
             )
 
+        _log_result(results_log, "End-to-End ReAct", results[-1])
+
     # Compute aggregates
     metrics = compute_aggregate_metrics(results)
 
@@ -344,16 +475,7 @@ def run_react_eval(
     return {
         "name": "End-to-End ReAct",
         "metrics": metrics.to_dict(),
-        "detailed_results": [
-            {
-                "id": r.example_id,
-                "hit_at_1": r.hit_at_1,
-                "hit_at_3": r.hit_at_3,
-                "constraints": r.constraint_satisfaction,
-                "predicted": r.predicted_top_pick[:50],
-            }
-            for r in results
-        ],
+        "detailed_results": [_result_detail(r) for r in results],
     }
 
 
@@ -362,6 +484,8 @@ def run_all_evals(
     verbose: bool = False,
     mode: str = "pipeline",
     example_id: str | None = None,
+    use_cache: bool = True,
+    results_log: TextIO | None = None,
 ) -> dict:
     """
     Run all evaluations and return comprehensive results.
@@ -371,21 +495,25 @@ def run_all_evals(
         verbose: Show detailed output
         mode: "pipeline", "react", or "both"
         example_id: If provided, only run this specific E2E example
+        use_cache: Serve repeated LM requests from dspy's response cache
+        results_log: Open JSONL file that per-example results stream to as they
+            finish, shared by all the evals
     """
     print(f"\n🎿 Powder Evaluation Suite")
     print(f"Model: {model}")
     print(f"Mode: {mode}")
     if example_id:
         print(f"Example: {example_id}")
-    print(f"Time: {datetime.now().isoformat()}")
+    now = datetime.now().isoformat()
+    print(f"Time: {now}")
 
     # Configure DSPy
-    dspy.configure(lm=dspy.LM(model))
+    dspy.configure(lm=_get_lm(model, cache=use_cache))
 
     results = {
         "model": model,
         "mode": mode,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now,
         "signatures": {},
         "end_to_end_pipeline": None,
         "end_to_end_react": None,
@@ -393,45 +521,40 @@ def run_all_evals(
 
     # Skip signature evals if running single E2E example
     if not example_id:
-        # 1. ParseSkiQuery
-        parse_result = run_signature_eval(
-            name="ParseSkiQuery",
-            examples=parse_query.get_examples(),
-            predictor=load_optimized_predictor(ParseSkiQuery, "parse_query"),
-            metric_fn=parse_query.get_metric(),
-            verbose=verbose,
-        )
-        results["signatures"]["ParseSkiQuery"] = parse_result
-
-        # 2. AssessConditions
-        assess_result = run_signature_eval(
-            name="AssessConditions",
-            examples=assess_conditions.get_examples(),
-            predictor=load_optimized_predictor(AssessConditions, "assess_conditions"),
-            metric_fn=assess_conditions.get_metric(),
-            verbose=verbose,
-        )
-        results["signatures"]["AssessConditions"] = assess_result
-
-        # 3. ScoreMountain
-        score_result = run_signature_eval(
-            name="ScoreMountain",
-            examples=score_mountain.get_examples(),
-            predictor=load_optimized_predictor(ScoreMountain, "score_mountain"),
-            metric_fn=score_mountain.get_metric(),
-            verbose=verbose,
-        )
-        results["signatures"]["ScoreMountain"] = score_result
-
-        # 4. GenerateRecommendation
-        gen_result = run_signature_eval(
-            name="GenerateRecommendation",
-            examples=generate_recommendation.get_examples(),
-            predictor=load_optimized_predictor(GenerateRecommendation, "generate_recommendation"),
-            metric_fn=generate_recommendation.get_metric(),
-            verbose=verbose,
-        )
-        results["signatures"]["GenerateRecommendation"] = gen_result
+        signature_evals = [
+            ("ParseSkiQuery", parse_query, ParseSkiQuery, "parse_query"),
+            (
+                "AssessConditions",
+                assess_conditions,
+                AssessConditions,
+                "assess_conditions",
+            ),
+            ("ScoreMountain", score_mountain, ScoreMountain, "score_mountain"),
+            (
+                "GenerateRecommendation",
+                generate_recommendation,
+                GenerateRecommendation,
+                "generate_recommendation",
+            ),
+        ]
+
+        # Independent and LM-bound, so run all four at once (each one also
+        # fans out over its examples)
+        with ThreadPoolExecutor(max_workers=len(signature_evals)) as executor:
+            futures = [
+                executor.submit(
+                    run_signature_eval,
+                    name=name,
+                    examples=module.get_examples(),
+                    predictor=load_optimized_predictor(signature, optimized_name),
+                    metric_fn=module.get_metric(),
+                    verbose=verbose,
+                    results_log=results_log,
+                )
+                for name, module, signature, optimized_name in signature_evals
+            ]
+            for (name, *_), future in zip(signature_evals, futures):
+                results["signatures"][name] = future.result()
 
     # Filter E2E examples if specific example requested
     all_e2e_examples = get_e2e_examples()
@@ -445,53 +568,58 @@ def run_all_evals(
 
     # 5. End-to-End Pipeline
     if mode in ("pipeline", "both"):
-        e2e_pipeline = run_end_to_end_eval(e2e_examples, verbose=verbose)
+        e2e_pipeline = run_end_to_end_eval(
+            e2e_examples, verbose=verbose, results_log=results_log
+        )
         results["end_to_end_pipeline"] = e2e_pipeline
 
     # 6. End-to-End ReAct
     if mode in ("react", "both"):
-        e2e_react = run_react_eval(e2e_examples, verbose=verbose)
+        e2e_react = run_react_eval(
+            e2e_examples, verbose=verbose, results_log=results_log
+        )
         results["end_to_end_react"] = e2e_react
 
-    # Summary
-    print(f"\n{'=' * 60}")
-    print("EVALUATION SUMMARY")
-    print(f"{'=' * 60}")
+    # Summary, printed as one block
+    lines = ["", "=" * 60, "EVALUATION SUMMARY", "=" * 60]
 
     if results["signatures"]:
-        print("\nSignature Metrics (avg score):")
+        lines.append("\nSignature Metrics (avg score):")
         for name, data in results["signatures"].items():
             bar = "█" * int(data["avg_score"] * 20)
-            print(f"  {name:25} {data['avg_score']:5.1%} {bar}")
-
-    if results["end_to_end_pipeline"]:
-        print("\nEnd-to-End Pipeline Metrics:")
-        e2e = results["end_to_end_pipeline"]["metrics"]
-        print(f"  Hit@1:                   {e2e['hit_at_1']}")
-        print(f"  Hit@3:                   {e2e['hit_at_3']}")
-        print(f"  Constraint Satisfaction: {e2e['constraint_satisfaction']}")
-        print(f"  Exclusion Check:         {e2e['exclusion_check']}")
-
-    if results["end_to_end_react"]:
-        print("\nEnd-to-End ReAct Metrics:")
-        e2e = results["end_to_end_react"]["metrics"]
-        print(f"  Hit@1:                   {e2e['hit_at_1']}")
-        print(f"  Hit@3:                   {e2e['hit_at_3']}")
-        print(f"  Constraint Satisfaction: {e2e['constraint_satisfaction']}")
-        print(f"  Exclusion Check:         {e2e['exclusion_check']}")
+            lines.append(f"  {name:25} {data['avg_score']:5.1%} {bar}")
+
+    for key, label in (
+        ("end_to_end_pipeline", "Pipeline"),
+        ("end_to_end_react", "ReAct"),
+    ):
+        if results[key]:
+            e2e = results[key]["metrics"]
+            lines += [
+                f"\nEnd-to-End {label} Metrics:",
+                f"  Hit@1:                   {e2e['hit_at_1']}",
+                f"  Hit@3:                   {e2e['hit_at_3']}",
+                f"  Constraint Satisfaction: {e2e['constraint_satisfaction']}",
+                f"  Exclusion Check:         {e2e['exclusion_check']}",
+            ]
 
     # Comparison if both ran
     if results["end_to_end_pipeline"] and results["end_to_end_react"]:
-        print("\n--- Pipeline vs ReAct Comparison ---")
         p = results["end_to_end_pipeline"]["metrics"]
         r = results["end_to_end_react"]["metrics"]
-        print(f"  {'Metric':<25} {'Pipeline':>10} {'ReAct':>10}")
-        print(f"  {'-'*45}")
-        print(f"  {'Hit@1':<25} {p['hit_at_1']:>10} {r['hit_at_1']:>10}")
-        print(f"  {'Hit@3':<25} {p['hit_at_3']:>10} {r['hit_at_3']:>10}")
-        print(
-            f"  {'Constraint Satisfaction':<25} {p['constraint_satisfaction']:>10} {r['constraint_satisfaction']:>10}"
-        )
+        lines += [
+            "\n--- Pipeline vs ReAct Comparison ---",
+            f"  {'Metric':<25} {'Pipeline':>10} {'ReAct':>10}",
+            f"  {'-'*45}",
+        ]
+        for metric, key in (
+            ("Hit@1", "hit_at_1"),
+            ("Hit@3", "hit_at_3"),
+            ("Constraint Satisfaction", "constraint_satisfaction"),
+        ):
+            lines.append(f"  {metric:<25} {p[key]:>10} {r[key]:>10}")
+
+    print("\n".join(lines))
 
     return results
 
@@ -499,10 +627,17 @@ def run_all_evals(
 def save_results(results: dict, output_path: Path | None = None):
     """Save evaluation results to JSON file."""
     if output_path is None:
-        output_path = Path(__file__).parent.parent.parent / "eval_results.json"
-
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+        output_path = DEFAULT_RESULTS_PATH
+
+    # orjson writes bytes; OPT_NON_STR_KEYS matches json.dump's int-key handling
+    with open(output_path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+        )
 
     print(f"\nResults saved to: {output_path}")
 
@@ -540,6 +675,11 @@ def main():
         action="store_true",
         help="Only run signature evals, skip end-to-end",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass dspy's LM response cache and call the LM again",
+    )
     parser.add_argument(
         "--example",
         "-e",
@@ -556,12 +696,19 @@ def main():
         print("Error: ANTHROPIC_API_KEY environment variable not set")
         sys.exit(1)
 
-    results = run_all_evals(
-        model=args.model,
-        verbose=args.verbose,
-        mode=args.mode,
-        example_id=args.example,
-    )
+    # Per-example results always stream next to the summary JSON, so a
+    # crashed run keeps what it scored
+    log_path = (args.output or DEFAULT_RESULTS_PATH).with_suffix(".jsonl")
+    with open(log_path, "w") as results_log:
+        results = run_all_evals(
+            model=args.model,
+            verbose=args.verbose,
+            mode=args.mode,
+            example_id=args.example,
+            use_cache=not args.no_cache,
+            results_log=results_log,
+        )
+    print(f"Per-example results logged to: {log_path}")
 
     if args.output:
         save_results(results, args.output)
@@ -13,18 +13,42 @@ import json
 import dspy
 
 
+# Expected keyword lists that get a lowercased "<key>_lower" companion
+LOWERED_FIELDS = ("expected_pros_mention", "expected_cons_mention")
+
+
+def _lowered(example: dspy.Example, key: str) -> tuple[str, ...]:
+    """example.<key>_lower, or example.<key> lowercased for hand-built examples."""
+    lowered = example.get(f"{key}_lower")
+    if lowered is None:
+        lowered = tuple(kw.lower() for kw in example[key])
+    return lowered
+
+
 def make_example(
     mountain: dict,
     user_preferences: dict,
     day_context: str,
     expected: dict,
 ) -> dspy.Example:
-    """Create a ScoreMountain evaluation example."""
+    """Create a ScoreMountain evaluation example.
+
+    Lowercased copies of the expected keyword lists are precomputed here so
+    the metric only lowercases the prediction. mountain_name is kept as a
+    label so reports don't have to parse the mountain JSON back.
+    """
+    lowered = {
+        f"{key}_lower": tuple(kw.lower() for kw in expected[key])
+        for key in LOWERED_FIELDS
+        if key in expected
+    }
     return dspy.Example(
         mountain=json.dumps(mountain),
         user_preferences=json.dumps(user_preferences),
         day_context=day_context,
+        mountain_name=mountain["name"],
         **expected,
+        **lowered,
     ).with_inputs("mountain", "user_preferences", "day_context")
 
 
@@ -344,19 +368,19 @@ STOWE_IKON_HOLDER = make_example(
 )
 
 
-# All examples
-TRAIN_EXAMPLES = [
+# All examples - tuples so no caller can change them between runs
+TRAIN_EXAMPLES = (
     STOWE_POWDER_DAY,
     KILLINGTON_ICY_DAY,
     JAY_WINDY_DAY,
     OKEMO_PARK,
     NASHOBA_POWDER_CHASER,
     STOWE_IKON_HOLDER,
-]
-VAL_EXAMPLES = [
+)
+VAL_EXAMPLES = (
     OKEMO_FAMILY_DAY,
     NASHOBA_CASUAL,
-]
+)
 
 
 # --- Metric Function ---
@@ -369,7 +393,7 @@ def score_mountain_metric(
     Score a ScoreMountain prediction with rule-based metrics.
 
     Checks:
-    1. Score validity: is it a number between 0-100?
+    1. Score validity: is it between 0-100?
     2. Score range: is it within expected range for this scenario?
     3. Grounding: do pros mention expected keywords?
     4. Grounding: do cons mention expected keywords?
@@ -380,17 +404,13 @@ def score_mountain_metric(
     """
     scores = []
 
-    # 1. Score validity - must be a number 0-100
-    try:
-        score_val = float(pred.score)
-        valid_range = 0 <= score_val <= 100
-        scores.append(1.0 if valid_range else 0.0)
-    except (ValueError, TypeError):
-        scores.append(0.0)
-        score_val = None
+    # 1. Score validity - ScoreMountain parses score as a float, so only the
+    # range can be off
+    score_val = pred.score
+    scores.append(1.0 if 0 <= score_val <= 100 else 0.0)
 
     # 2. Score in expected range
-    if score_val is not None and hasattr(example, "expected_score_min"):
+    if hasattr(example, "expected_score_min"):
         min_score = example.expected_score_min
         max_score = example.expected_score_max
 
@@ -404,18 +424,18 @@ def score_mountain_metric(
 
     # 3. Pros grounding - check if expected keywords are mentioned
     if hasattr(example, "expected_pros_mention"):
-        keywords = example.expected_pros_mention
+        keywords = _lowered(example, "expected_pros_mention")
         pros_text = pred.key_pros.lower()
-        matches = sum(1 for kw in keywords if kw.lower() in pros_text)
+        matches = sum(1 for kw in keywords if kw in pros_text)
         # At least 2 of the expected keywords should appear
         pros_score = min(matches / 2, 1.0)
         scores.append(pros_score)
 
     # 4. Cons grounding - check if expected keywords are mentioned
     if hasattr(example, "expected_cons_mention"):
-        keywords = example.expected_cons_mention
+        keywords = _lowered(example, "expected_cons_mention")
         cons_text = pred.key_cons.lower()
-        matches = sum(1 for kw in keywords if kw.lower() in cons_text)
+        matches = sum(1 for kw in keywords if kw in cons_text)
         # At least 1 of the expected keywords should appear
         cons_score = min(matches / 1, 1.0)
         scores.append(cons_score)
@@ -429,17 +449,17 @@ def score_mountain_metric(
 
 def get_examples() -> list[dspy.Example]:
     """Get all examples."""
-    return TRAIN_EXAMPLES + VAL_EXAMPLES
+    return [*TRAIN_EXAMPLES, *VAL_EXAMPLES]
 
 
 def get_trainset() -> list[dspy.Example]:
     """Get training examples (first 6 of 8 = 75%)."""
-    return TRAIN_EXAMPLES
+    return list(TRAIN_EXAMPLES)
 
 
 def get_valset() -> list[dspy.Example]:
     """Get validation examples (last 2 of 8 = 25%)."""
-    return VAL_EXAMPLES
+    return list(VAL_EXAMPLES)
 
 
 def get_metric():
@@ -455,18 +475,11 @@ def score_detailed(example: dspy.Example, pred: dspy.Prediction) -> dict:
     details = {}
 
     # Score validity
-    try:
-        score_val = float(pred.score)
-        details["score_valid"] = {
-            "score": score_val,
-            "valid": 0 <= score_val <= 100,
-        }
-    except (ValueError, TypeError):
-        details["score_valid"] = {"score": pred.score, "valid": False}
-        score_val = None
+    score_val = pred.score
+    details["score_valid"] = {"score": score_val, "valid": 0 <= score_val <= 100}
 
     # Score range
-    if score_val and hasattr(example, "expected_score_min"):
+    if hasattr(example, "expected_score_min"):
         in_range = example.expected_score_min <= score_val <= example.expected_score_max
         details["score_range"] = {
             "expected": f"{example.expected_score_min}-{example.expected_score_max}",
@@ -504,7 +517,6 @@ def score_detailed(example: dspy.Example, pred: dspy.Prediction) -> dict:
 
 
 if __name__ == "__main__":
-    import dspy
     from powder.signatures import ScoreMountain
 
     dspy.configure(lm=dspy.LM("anthropic/claude-haiku-4-5-20251001"))
@@ -523,8 +535,7 @@ if __name__ == "__main__":
         score = score_mountain_metric(example, pred)
         total_score += score
 
-        mountain_name = json.loads(example.mountain)["name"]
-        print(f"Example {i + 1}: {mountain_name}")
+        print(f"Example {i + 1}: {example.mountain_name}")
         print(f"  Predicted score: {pred.score}")
         print(f"  Metric score: {score:.2f}")
 
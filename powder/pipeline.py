@@ -1,8 +1,13 @@
 """Explicit multi-step ski recommendation pipeline using DSPy signatures."""
 
+import asyncio
+import contextvars
 import json
 import dspy
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 from sqlalchemy.orm import sessionmaker
@@ -12,6 +17,7 @@ from powder.signatures import (
     ParsedQuery,
     AssessConditions,
     ScoreMountain,
+    ScoreMountains,
     GenerateRecommendation,
 )
 from powder.tools.database import get_engine, query_mountains
@@ -20,6 +26,35 @@ from powder.tools.routing import get_drive_time, estimate_max_distance_km
 from powder.tools.crowds import get_crowd_context
 
 
+# One fan-out pool for the weather/routing lookups and per-mountain scoring
+# calls of every pipeline and query. Callers that run queries concurrently
+# (e.g. the eval runner) then share a single bound on threads and in-flight
+# requests instead of each query opening its own pool. Tasks submitted here
+# never submit more work to it, so it can't deadlock.
+FANOUT_WORKERS = 16
+_FANOUT = ThreadPoolExecutor(max_workers=FANOUT_WORKERS)
+
+
+def _submit(fn, *args, **kwargs) -> Future:
+    """
+    Run fn on the shared pool in a copy of the caller's context.
+
+    Context-local state (dspy.context settings, the eval harness's
+    per-example weather fixture) carries over to the worker thread.
+    """
+    return _FANOUT.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def _clamp_score(score: float) -> float:
+    """Keep an LM score inside 0-100; DSPy only checks that it's a number."""
+    return min(max(score, 0.0), 100.0)
+
+
+def _name_key(name: str) -> str:
+    """Name as matched against batch-scoring output, ignoring case and spacing."""
+    return " ".join(name.lower().split())
+
+
 class SkiPipeline(dspy.Module):
     """
     Explicit multi-step pipeline for ski recommendations.
@@ -38,7 +73,12 @@ class SkiPipeline(dspy.Module):
     - Easier debugging and evaluation
     """
 
-    def __init__(self, db_path: Path | None = None, use_optimized: bool = True):
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        use_optimized: bool = True,
+        use_batch_scoring: bool = False,
+    ):
         super().__init__()
 
         # Path to optimized modules
@@ -65,9 +105,21 @@ class SkiPipeline(dspy.Module):
             GenerateRecommendation,
             use_optimized,
         )
+        # Opt-in: score all candidates in one LM call instead of one call each.
+        # Cheaper, but bypasses the GEPA-optimized per-mountain ScoreMountain.
+        self.score_mountains = (
+            self._load_or_create(
+                optimized_dir / "score_mountains.json",
+                ScoreMountains,
+                use_optimized,
+            )
+            if use_batch_scoring
+            else None
+        )
 
-        # Database path
+        # Database path; one engine (and connection pool) per pipeline
         self.db_path = db_path or Path(__file__).parent / "data" / "mountains.db"
+        self._Session = sessionmaker(bind=get_engine(self.db_path))
 
     def _load_or_create(
         self,
@@ -106,9 +158,7 @@ class SkiPipeline(dspy.Module):
         max_drive_hours = parsed.max_drive_hours or 3.0
         max_distance_km = estimate_max_distance_km(max_drive_hours)
 
-        engine = get_engine(self.db_path)
-        Session = sessionmaker(bind=engine)
-        session = Session()
+        session = self._Session()
 
         try:
             # Pydantic validators already coerce 'null' -> None
@@ -128,46 +178,129 @@ class SkiPipeline(dspy.Module):
         finally:
             session.close()
 
-    def _enrich_with_conditions(
+    def _drive_time(self, mountain: dict, user_lat: float, user_lon: float) -> dict:
+        """Actual drive time to a mountain, or an estimate if routing fails."""
+        try:
+            return get_drive_time(user_lat, user_lon, mountain["lat"], mountain["lon"])
+        except Exception:
+            # Fallback to estimate based on haversine distance
+            return {
+                "duration_minutes": mountain.get("distance_km", 100) * 0.75,
+                "distance_km": mountain.get("distance_km", 100),
+                "error": "routing_api_failed",
+            }
+
+    def _enrich(
         self,
         candidates: list[dict],
         target_date: date,
+        user_lat: float,
+        user_lon: float,
     ) -> list[dict]:
-        """Add weather conditions to each candidate."""
-        enriched = []
-        for mountain in candidates:
-            conditions = get_conditions(mountain["lat"], mountain["lon"], target_date)
-            enriched.append({**mountain, "conditions": conditions})
-        return enriched
-
-    def _enrich_with_drive_times(
+        """Add weather conditions and drive times to each candidate, in place."""
+        # Every lookup is an independent HTTP call, so issue them all at once
+        futures = [
+            (
+                _submit(get_conditions, mountain["lat"], mountain["lon"], target_date),
+                _submit(self._drive_time, mountain, user_lat, user_lon),
+            )
+            for mountain in candidates
+        ]
+        # Candidates are fresh dicts from query_mountains, so fill them in
+        # rather than copying every key into a new dict
+        for mountain, (conditions, drive_time) in zip(candidates, futures):
+            mountain["conditions"] = conditions.result()
+            mountain["drive_time"] = drive_time.result()
+        return candidates
+
+    def _score_each(
         self,
         candidates: list[dict],
-        user_lat: float,
-        user_lon: float,
+        mountain_json: list[str],
+        user_prefs: str,
+        day_context: str,
     ) -> list[dict]:
-        """Add actual drive times to each candidate."""
-        enriched = []
-        for mountain in candidates:
+        """Score candidates with one ScoreMountain call each, run concurrently."""
+        # Each call is submitted exactly once; a slow one is waited for (the LM
+        # client has its own timeout) rather than resubmitted and paid twice
+        futures = [
+            _submit(
+                self.score_mountain,
+                mountain=mountain,
+                user_preferences=user_prefs,
+                day_context=day_context,
+            )
+            for mountain in mountain_json
+        ]
+
+        scored = []
+        for mountain, future in zip(candidates, futures):
             try:
-                drive_info = get_drive_time(
-                    user_lat, user_lon, mountain["lat"], mountain["lon"]
-                )
+                score_result = future.result()
             except Exception:
-                # Fallback to estimate based on haversine distance
-                drive_info = {
-                    "duration_minutes": mountain.get("distance_km", 100) * 0.75,
-                    "distance_km": mountain.get("distance_km", 100),
-                    "error": "routing_api_failed",
-                }
-            enriched.append({**mountain, "drive_time": drive_info})
-        return enriched
+                # Scoring call failed: rank it last instead of failing the query
+                scored.append({
+                    "mountain": mountain,
+                    "score": 0,
+                    "key_pros": "",
+                    "key_cons": "error: could not score this mountain",
+                    "tradeoff_note": "",
+                })
+                continue
+            scored.append({
+                "mountain": mountain,
+                "score": _clamp_score(score_result.score),
+                "key_pros": score_result.key_pros,
+                "key_cons": score_result.key_cons,
+                "tradeoff_note": score_result.tradeoff_note,
+            })
+        return scored
+
+    def _score_batch(
+        self,
+        candidates: list[dict],
+        candidates_json: str,
+        user_prefs: str,
+        day_context: str,
+    ) -> list[dict] | None:
+        """
+        Score all candidates in a single ScoreMountains call.
+
+        Entries are matched to candidates by name, not position, since the LM
+        may reorder them. Returns None if the call fails or any candidate has
+        no entry, so the caller can fall back to per-mountain scoring.
+        """
+        try:
+            result = self.score_mountains(
+                mountains=candidates_json,
+                user_preferences=user_prefs,
+                day_context=day_context,
+            )
+        except Exception:
+            return None
+
+        by_name = {_name_key(entry.name): entry for entry in result.scores}
+        entries = [by_name.get(_name_key(mountain["name"])) for mountain in candidates]
+        if None in entries:
+            return None
+
+        return [
+            {
+                "mountain": mountain,
+                "score": _clamp_score(entry.score),
+                "key_pros": entry.key_pros,
+                "key_cons": entry.key_cons,
+                "tradeoff_note": entry.tradeoff_note,
+            }
+            for mountain, entry in zip(candidates, entries)
+        ]
 
     def forward(
         self,
         query: str,
         current_date: date | None = None,
         user_location: dict | None = None,
+        parsed: ParsedQuery | None = None,
     ) -> dspy.Prediction:
         """
         Run the full recommendation pipeline.
@@ -176,6 +309,7 @@ class SkiPipeline(dspy.Module):
             query: Natural language ski query
             current_date: Override current date (default: today)
             user_location: Dict with 'name', 'lat', 'lon' (default: Boston)
+            parsed: Query already parsed by ParseSkiQuery; skips step 1
 
         Returns:
             Prediction with top_pick, alternatives, caveat, and intermediate results
@@ -188,17 +322,17 @@ class SkiPipeline(dspy.Module):
             "lon": -71.0589,
         }
 
-        # Build user context for parsing
-        user_context = (
-            f"Today's date: {current_date.isoformat()}\n"
-            f"Tomorrow's date: {(current_date + timedelta(days=1)).isoformat()}\n"
-            f"User's location: {user_location['name']} "
-            f"({user_location['lat']}, {user_location['lon']})"
-        )
-
         # Step 1: Parse query -> returns ParsedQuery Pydantic model
-        result = self.parse_query(query=query, user_context=user_context)
-        parsed = result.parsed  # ParsedQuery with proper types
+        if parsed is None:
+            # Build user context for parsing
+            user_context = (
+                f"Today's date: {current_date.isoformat()}\n"
+                f"Tomorrow's date: {(current_date + timedelta(days=1)).isoformat()}\n"
+                f"User's location: {user_location['name']} "
+                f"({user_location['lat']}, {user_location['lon']})"
+            )
+            result = self.parse_query(query=query, user_context=user_context)
+            parsed = result.parsed  # ParsedQuery with proper types
 
         # Resolve target date
         target_date = self._resolve_date(parsed.target_date, current_date)
@@ -219,11 +353,15 @@ class SkiPipeline(dspy.Module):
             )
 
         # Step 3: Enrich with conditions and drive times
-        candidates = self._enrich_with_conditions(candidates, target_date)
-        candidates = self._enrich_with_drive_times(
-            candidates, user_location["lat"], user_location["lon"]
+        candidates = self._enrich(
+            candidates, target_date, user_location["lat"], user_location["lon"]
         )
 
+        # Serialize each candidate once for all the prompts below. Joined, they
+        # match json.dumps(candidates) byte for byte, so prompts are unchanged.
+        mountain_json = [json.dumps(mountain) for mountain in candidates]
+        candidates_json = "[" + ", ".join(mountain_json) + "]"
+
         # Step 4: Assess overall day conditions
         user_prefs = json.dumps({
             "skill_level": parsed.skill_level,
@@ -236,7 +374,7 @@ class SkiPipeline(dspy.Module):
         })
 
         day_assessment = self.assess_conditions(
-            all_candidates=json.dumps(candidates),
+            all_candidates=candidates_json,
             user_preferences=user_prefs,
         )
 
@@ -247,23 +385,19 @@ class SkiPipeline(dspy.Module):
         )
 
         # Step 5: Score each mountain
-        scored = []
-        for mountain in candidates:
-            score_result = self.score_mountain(
-                mountain=json.dumps(mountain),
-                user_preferences=user_prefs,
-                day_context=day_context,
+        scored = None
+        if self.score_mountains is not None:
+            scored = self._score_batch(
+                candidates, candidates_json, user_prefs, day_context
+            )
+        if scored is None:
+            scored = self._score_each(
+                candidates, mountain_json, user_prefs, day_context
             )
-            scored.append({
-                "mountain": mountain,
-                "score": score_result.score,
-                "key_pros": score_result.key_pros,
-                "key_cons": score_result.key_cons,
-                "tradeoff_note": score_result.tradeoff_note,
-            })
 
-        # Sort by score descending
-        scored.sort(key=lambda x: float(x["score"]), reverse=True)
+        # Sort by score descending (scores are clamped floats). The full ranking
+        # is returned and read by the evals, so sort it all, not just the top 5
+        scored.sort(key=itemgetter("score"), reverse=True)
 
         # Step 6: Get crowd context for top candidates
         crowd_info = get_crowd_context(target_date, scored[0]["mountain"]["state"])
@@ -288,12 +422,65 @@ class SkiPipeline(dspy.Module):
             crowd_info=crowd_info,
         )
 
+    async def aforward(
+        self,
+        query: str,
+        current_date: date | None = None,
+        user_location: dict | None = None,
+        parsed: ParsedQuery | None = None,
+    ) -> dspy.Prediction:
+        """
+        Async entry point (pipeline.acall) for callers on an event loop.
+
+        Runs the sync pipeline in a worker thread so the loop isn't blocked. The steps
+        depend on each other, and the I/O-heavy ones already fan out inside
+        forward, so there is nothing more to overlap here.
+        """
+        return await asyncio.to_thread(
+            self, query, current_date, user_location, parsed=parsed
+        )
+
+
+@lru_cache(maxsize=4)
+def _get_pipeline(use_optimized: bool, use_batch_scoring: bool = False) -> SkiPipeline:
+    """One pipeline (predictors and DB engine) per setting, reused across calls."""
+    return SkiPipeline(
+        use_optimized=use_optimized, use_batch_scoring=use_batch_scoring
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_parse_predictor(use_optimized: bool) -> dspy.Predict:
+    """
+    Standalone ParseSkiQuery predictor, reused across calls.
+
+    Lets callers that only need a parse (e.g. react mode's date check) skip
+    building a full SkiPipeline and its DB engine.
+    """
+    optimized_path = Path(__file__).parent / "optimized" / "parse_query.json"
+    predictor = dspy.Predict(ParseSkiQuery)
+    if use_optimized and optimized_path.exists():
+        predictor.load(optimized_path)
+    return predictor
+
+
+def parse_query(
+    query: str,
+    user_context: str,
+    use_optimized: bool = True,
+) -> ParsedQuery:
+    """Parse a query with the shared ParseSkiQuery predictor."""
+    predictor = _get_parse_predictor(use_optimized)
+    return predictor(query=query, user_context=user_context).parsed
+
 
 def recommend(
     query: str,
     current_date: date | None = None,
     user_location: dict | None = None,
     use_optimized: bool = True,
+    parsed: ParsedQuery | None = None,
+    use_batch_scoring: bool = False,
 ) -> dict:
     """
     Get ski recommendations using the explicit pipeline.
@@ -303,12 +490,14 @@ def recommend(
         current_date: Override current date
         user_location: Override location dict
         use_optimized: Whether to use GEPA-optimized prompts (default: True)
+        parsed: Query already parsed by ParseSkiQuery, to skip re-parsing
+        use_batch_scoring: Score all candidates in one LM call (ScoreMountains)
 
     Returns:
         Dict with top_pick, alternatives, caveat
     """
-    pipeline = SkiPipeline(use_optimized=use_optimized)
-    result = pipeline(query, current_date, user_location)
+    pipeline = _get_pipeline(use_optimized, use_batch_scoring)
+    result = pipeline(query, current_date, user_location, parsed=parsed)
 
     return {
         "top_pick": result.top_pick,
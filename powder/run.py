@@ -8,30 +8,34 @@ import dspy
 from dotenv import load_dotenv
 
 from powder.agent import recommend as react_recommend, build_user_context
-from powder.pipeline import recommend as pipeline_recommend
-from powder.signatures import ParseSkiQuery
+from powder.pipeline import parse_query, recommend as pipeline_recommend
+from powder.signatures import ParsedQuery
 
 
-def clarify_date_if_needed(query: str) -> str:
-    """Check if query specifies a date, ask user if not."""
+def clarify_date_if_needed(query: str) -> tuple[str, ParsedQuery]:
+    """
+    Check if query specifies a date, ask user if not.
+
+    Returns the (possibly clarified) query and its parse, so the pipeline can
+    reuse the parse instead of calling ParseSkiQuery a second time.
+    """
     user_context = build_user_context()
 
-    # Use ParseSkiQuery to check if date is specified
-    parser = dspy.Predict(ParseSkiQuery)
-    result = parser(query=query, user_context=user_context)
+    # Use ParseSkiQuery to check if date is specified. This only loads the
+    # (optimized) parse predictor, not the whole pipeline.
+    parsed = parse_query(query, user_context)
 
-    if result.target_date == "unspecified":
+    if parsed.target_date == "unspecified":
         print("When are you looking to ski?")
         print("  1. Today")
         print("  2. Tomorrow")
         choice = input("Enter 1 or 2: ").strip()
 
-        if choice == "1":
-            return f"{query} today"
-        else:
-            return f"{query} tomorrow"
+        # The answer only fills in the date, so update the parse directly
+        parsed.target_date = "today" if choice == "1" else "tomorrow"
+        return f"{query} {parsed.target_date}", parsed
 
-    return query
+    return query, parsed
 
 
 def main():
@@ -53,6 +57,11 @@ def main():
         default="pipeline",
         help="Agent mode: 'react' (dynamic tool use) or 'pipeline' (explicit steps)",
     )
+    parser.add_argument(
+        "--batch-scoring",
+        action="store_true",
+        help="Pipeline mode: score all candidate mountains in one LM call",
+    )
     args = parser.parse_args()
 
     # Load .env file
@@ -65,13 +74,15 @@ def main():
     dspy.configure(lm=dspy.LM(args.model))
 
     # Clarify date if not specified
-    query = clarify_date_if_needed(args.query)
+    query, parsed = clarify_date_if_needed(args.query)
 
     if args.mode == "react":
         result = react_recommend(query)
         print(result)
     else:
-        result = pipeline_recommend(query)
+        result = pipeline_recommend(
+            query, parsed=parsed, use_batch_scoring=args.batch_scoring
+        )
         print(f"\nTop Pick: {result['top_pick']}")
         print(f"\nAlternatives: {result['alternatives']}")
         if result['caveat']:
@@ -95,9 +95,11 @@ class ScoreMountain(dspy.Signature):
     - Drive >3hrs with poor conditions: Cap at 50 (not worth the drive)
     """
 
-    mountain: str = dspy.InputField(desc="Mountain data with current conditions")
+    # Inputs shared by every mountain in a query come first, so the N per-query
+    # prompts share the longest possible prefix for provider prompt caching
     user_preferences: str = dspy.InputField(desc="Parsed preferences from query")
     day_context: str = dspy.InputField(desc="Overall day quality and mode")
+    mountain: str = dspy.InputField(desc="Mountain data with current conditions")
 
     score: float = dspy.OutputField(
         desc="0-100 appeal score - BE HARSH, most mountains on most days deserve 40-65"
@@ -109,6 +111,46 @@ class ScoreMountain(dspy.Signature):
     )
 
 
+class MountainScore(BaseModel):
+    """One mountain's entry in a ScoreMountains batch - same fields as ScoreMountain."""
+
+    name: str
+    score: float
+    key_pros: str
+    key_cons: str
+    tradeoff_note: str
+
+
+class ScoreMountains(dspy.Signature):
+    """Score every candidate mountain in one pass, given conditions, preferences, and day context.
+
+    Batched form of ScoreMountain: score each mountain independently with the
+    same calibration, and return exactly one entry per input mountain, in order.
+
+    Score calibration (BE HARSH - most days are not 70+):
+    - 85-100: Exceptional - significant fresh snow, ideal temps, matches preferences perfectly
+    - 70-84: Good day - meaningful fresh snow OR excellent groomed with good temps
+    - 55-69: Acceptable - skiable but not exciting, or good snow with significant drawbacks
+    - 40-54: Marginal - only go if you're desperate to ski, conditions are poor
+    - 0-39: Skip it - dangerous cold, no snow, or fundamentally unsuitable
+
+    Automatic penalties:
+    - Temps <10°F: Cap score at 60 max (brutal conditions regardless of snow)
+    - Temps <0°F: Cap score at 40 max (dangerous, stay home)
+    - Fresh snow <1": -15 points (you're skiing old snow)
+    - Wind >25mph: -10 points (miserable lift rides, closed terrain)
+    - Drive >3hrs with poor conditions: Cap at 50 (not worth the drive)
+    """
+
+    mountains: str = dspy.InputField(desc="JSON list of mountains with current conditions")
+    user_preferences: str = dspy.InputField(desc="Parsed preferences from query")
+    day_context: str = dspy.InputField(desc="Overall day quality and mode")
+
+    scores: list[MountainScore] = dspy.OutputField(
+        desc="One entry per input mountain, same order - BE HARSH, most deserve 40-65"
+    )
+
+
 class GenerateRecommendation(dspy.Signature):
     """Generate final recommendation with tradeoff analysis.
 
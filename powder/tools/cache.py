@@ -0,0 +1,59 @@
+"""Small in-process TTL cache for the HTTP-backed tools."""
+
+import copy
+import functools
+import threading
+import time
+
+
+def ttl_cache(ttl_seconds: float, maxsize: int = 1024, coord_digits: int = 3):
+    """
+    Cache a function's results for ttl_seconds, keyed by its arguments.
+
+    Float arguments (coordinates) are rounded to coord_digits (~100m at 3) so
+    near-identical lookups share an entry. Results are deep-copied so callers
+    can't modify the cached value, nested lists and dicts included. Exceptions
+    are never cached.
+
+    The wrapped function gains cache_clear().
+    """
+
+    def decorator(fn):
+        cache: dict[tuple, tuple[float, dict]] = {}
+        lock = threading.Lock()
+
+        def make_key(args, kwargs) -> tuple:
+            def norm(value):
+                return round(value, coord_digits) if isinstance(value, float) else value
+
+            return (
+                tuple(norm(a) for a in args),
+                tuple(sorted((k, norm(v)) for k, v in kwargs.items())),
+            )
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return copy.deepcopy(entry[1])
+
+            result = fn(*args, **kwargs)
+
+            with lock:
+                cache[key] = (now + ttl_seconds, result)
+                if len(cache) > maxsize:
+                    # Drop expired entries first, then the oldest inserted
+                    for k in [k for k, (expires, _) in cache.items() if expires <= now]:
+                        del cache[k]
+                    while len(cache) > maxsize:
+                        del cache[next(iter(cache))]
+            return copy.deepcopy(result)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
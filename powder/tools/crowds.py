@@ -1,6 +1,8 @@
 """Crowd calendar for ski mountains."""
 
 from datetime import date, timedelta
+from functools import lru_cache
+from typing import NamedTuple
 
 
 def _nthday_of_month(year: int, month: int, weekday: int, n: int) -> date:
@@ -12,6 +14,59 @@ def _nthday_of_month(year: int, month: int, weekday: int, n: int) -> date:
     return first_occurrence + timedelta(weeks=n - 1)
 
 
+# Months any holiday window can touch; NY vacation can run into early March
+_HOLIDAY_MONTHS = frozenset({12, 1, 2, 3})
+
+
+class _HolidayWindows(NamedTuple):
+    """One season year's holiday dates and vacation-week bounds."""
+
+    christmas_start: date
+    christmas_end: date
+    new_years_start: date
+    new_years_end: date
+    mlk_weekend: tuple[date, date, date]
+    ma_vacation_start: date
+    ma_vacation_end: date
+    ny_vacation_start: date
+    ny_vacation_end: date
+
+
+@lru_cache(maxsize=8)
+def _holiday_windows(year: int) -> _HolidayWindows:
+    """Holiday calendar for a year, computed once and reused for every lookup."""
+    # MLK Weekend (3rd Monday of January + surrounding weekend)
+    mlk_monday = _nthday_of_month(year, 1, 0, 3)  # Monday = 0
+    mlk_saturday = mlk_monday - timedelta(days=2)
+    mlk_sunday = mlk_monday - timedelta(days=1)
+
+    # February vacation weeks are key for ski crowds
+    # MA/NH February Vacation: week containing Presidents Day (3rd Monday of Feb)
+    # NY February Vacation: typically the week AFTER MA/NH
+    presidents_monday = _nthday_of_month(year, 2, 0, 3)
+
+    # MA/NH: Saturday before Presidents Day through following Sunday
+    ma_vacation_start = presidents_monday - timedelta(days=2)  # Saturday
+    ma_vacation_end = presidents_monday + timedelta(days=6)  # Following Sunday
+
+    # NY: Monday after MA vacation ends through following Sunday
+    ny_vacation_start = presidents_monday + timedelta(days=7)  # Monday after
+    ny_vacation_end = ny_vacation_start + timedelta(days=6)  # Following Sunday
+
+    return _HolidayWindows(
+        # Christmas-New Year's (Dec 24 - Jan 2)
+        christmas_start=date(year, 12, 24),
+        christmas_end=date(year, 12, 31),
+        new_years_start=date(year, 1, 1),
+        new_years_end=date(year, 1, 2),
+        mlk_weekend=(mlk_saturday, mlk_sunday, mlk_monday),
+        ma_vacation_start=ma_vacation_start,
+        ma_vacation_end=ma_vacation_end,
+        ny_vacation_start=ny_vacation_start,
+        ny_vacation_end=ny_vacation_end,
+    )
+
+
 def get_crowd_context(target_date: date, mountain_state: str) -> dict:
     """Assess expected crowds for a date + location.
 
@@ -26,15 +81,15 @@ def get_crowd_context(target_date: date, mountain_state: str) -> dict:
         - crowd_level: "extreme" | "high" | "moderate" | "normal"
         - crowd_note: str explaining the crowd situation
     """
-    year = target_date.year
     is_weekend = target_date.weekday() >= 5  # Sat=5, Sun=6
 
-    # Christmas-New Year's (Dec 24 - Jan 2)
-    christmas_start = date(year, 12, 24)
-    christmas_end = date(year, 12, 31)
-    new_years_end = date(year, 1, 2)
+    # Most of the season has no holidays; skip the calendar checks entirely
+    if target_date.month not in _HOLIDAY_MONTHS:
+        return _regular_day(is_weekend)
+
+    windows = _holiday_windows(target_date.year)
 
-    if christmas_start <= target_date <= christmas_end:
+    if windows.christmas_start <= target_date <= windows.christmas_end:
         return {
             "is_holiday_weekend": True,
             "vacation_week": None,
@@ -42,7 +97,7 @@ def get_crowd_context(target_date: date, mountain_state: str) -> dict:
             "crowd_note": "Christmas week - expect extreme crowds everywhere",
         }
 
-    if date(year, 1, 1) <= target_date <= new_years_end:
+    if windows.new_years_start <= target_date <= windows.new_years_end:
         return {
             "is_holiday_weekend": True,
             "vacation_week": None,
@@ -50,12 +105,7 @@ def get_crowd_context(target_date: date, mountain_state: str) -> dict:
             "crowd_note": "New Year's holiday - expect extreme crowds everywhere",
         }
 
-    # MLK Weekend (3rd Monday of January + surrounding weekend)
-    mlk_monday = _nthday_of_month(year, 1, 0, 3)  # Monday = 0
-    mlk_saturday = mlk_monday - timedelta(days=2)
-    mlk_sunday = mlk_monday - timedelta(days=1)
-
-    if target_date in (mlk_saturday, mlk_sunday, mlk_monday):
+    if target_date in windows.mlk_weekend:
         return {
             "is_holiday_weekend": True,
             "vacation_week": None,
@@ -63,20 +113,7 @@ def get_crowd_context(target_date: date, mountain_state: str) -> dict:
             "crowd_note": "MLK weekend - expect high crowds",
         }
 
-    # February vacation weeks are key for ski crowds
-    # MA/NH February Vacation: week containing Presidents Day (3rd Monday of Feb)
-    # NY February Vacation: typically the week AFTER MA/NH
-    presidents_monday = _nthday_of_month(year, 2, 0, 3)
-
-    # MA/NH: Saturday before Presidents Day through following Sunday
-    ma_vacation_start = presidents_monday - timedelta(days=2)  # Saturday
-    ma_vacation_end = presidents_monday + timedelta(days=6)  # Following Sunday
-
-    # NY: Monday after MA vacation ends through following Sunday
-    ny_vacation_start = presidents_monday + timedelta(days=7)  # Monday after
-    ny_vacation_end = ny_vacation_start + timedelta(days=6)  # Following Sunday
-
-    if ma_vacation_start <= target_date <= ma_vacation_end:
+    if windows.ma_vacation_start <= target_date <= windows.ma_vacation_end:
         vacation_week = "MA/NH"
         # Maine gets less NY traffic, so during MA week it's extreme everywhere
         if mountain_state == "ME":
@@ -93,7 +130,7 @@ def get_crowd_context(target_date: date, mountain_state: str) -> dict:
             "crowd_note": crowd_note,
         }
 
-    if ny_vacation_start <= target_date <= ny_vacation_end:
+    if windows.ny_vacation_start <= target_date <= windows.ny_vacation_end:
         vacation_week = "NY"
         # Maine is further from NYC, less affected
         if mountain_state == "ME":
@@ -110,6 +147,11 @@ def get_crowd_context(target_date: date, mountain_state: str) -> dict:
             "crowd_note": crowd_note,
         }
 
+    return _regular_day(is_weekend)
+
+
+def _regular_day(is_weekend: bool) -> dict:
+    """Crowd context for a day outside every holiday window."""
     # Regular weekend vs weekday
     if is_weekend:
         return {
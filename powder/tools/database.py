@@ -3,7 +3,17 @@
 import math
 from pathlib import Path
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, Text
+from sqlalchemy import (
+    create_engine,
+    Column,
+    Integer,
+    String,
+    Float,
+    Boolean,
+    Text,
+    Index,
+    select,
+)
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 Base = declarative_base()
@@ -44,6 +54,8 @@ class Mountain(Base):
     has_ski_school = Column(Boolean, default=True)
     learning_area_quality = Column(Text)  # "excellent", "good", "basic"
 
+    __table_args__ = (Index("ix_mountains_lat_lon", "lat", "lon"),)
+
 
 VALID_STATES = {"VT", "NH", "ME", "MA", "NY", "CT", "RI"}
 VALID_PASS_TYPES = {"epic", "ikon", "indy"}
@@ -157,8 +169,62 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         math.sin(delta_lat / 2) ** 2
         + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    # Same as 2 * atan2(sqrt(a), sqrt(1 - a)) for 0 <= a <= 1, one call cheaper
+    return 2 * R * math.asin(math.sqrt(a))
+
+
+def bounding_box(
+    lat: float, lon: float, max_distance_km: float
+) -> tuple[float, float, float, float]:
+    """
+    Lat/lon box containing every point within max_distance_km (haversine).
+
+    Returns (min_lat, max_lat, min_lon, max_lon). The longitude span is the
+    exact widest point of the circle, so nothing haversine_km would accept is
+    cut off. It falls back to all longitudes if the circle reaches a pole or
+    crosses the antimeridian.
+    """
+    angle = max_distance_km / 6371
+    dlat = math.degrees(angle)
+
+    ratio = math.sin(angle) / math.cos(math.radians(lat))
+    if angle >= math.pi / 2 or ratio >= 1:
+        return lat - dlat, lat + dlat, -180.0, 180.0
+
+    dlon = math.degrees(math.asin(ratio))
+    if lon - dlon < -180 or lon + dlon > 180:
+        return lat - dlat, lat + dlat, -180.0, 180.0
+
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
+
+# Columns returned by query_mountains, in result-dict order
+SEARCH_COLUMNS = (
+    Mountain.id,
+    Mountain.name,
+    Mountain.state,
+    Mountain.lat,
+    Mountain.lon,
+    Mountain.vertical_drop,
+    Mountain.num_trails,
+    Mountain.num_lifts,
+    Mountain.green_pct,
+    Mountain.blue_pct,
+    Mountain.black_pct,
+    Mountain.double_black_pct,
+    Mountain.terrain_parks,
+    Mountain.glades,
+    Mountain.pass_types,
+    Mountain.allows_snowboarding,
+    Mountain.lift_types,
+    Mountain.has_night_skiing,
+    Mountain.avg_weekday_price,
+    Mountain.avg_weekend_price,
+    Mountain.snowmaking_pct,
+    Mountain.has_magic_carpet,
+    Mountain.has_ski_school,
+    Mountain.learning_area_quality,
+)
 
 
 def query_mountains(
@@ -193,7 +259,12 @@ def query_mountains(
     Returns:
         List of dicts with mountain data + distance_km, sorted by distance.
     """
-    query = session.query(Mountain)
+    # Cheap indexed box prefilter; the exact haversine check runs below
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, max_distance_km)
+    query = select(*SEARCH_COLUMNS).filter(
+        Mountain.lat.between(min_lat, max_lat),
+        Mountain.lon.between(min_lon, max_lon),
+    )
 
     if allows_snowboarding is not None:
         query = query.filter(Mountain.allows_snowboarding == allows_snowboarding)
@@ -217,36 +288,11 @@ def query_mountains(
     if needs_expert_terrain:
         query = query.filter(Mountain.double_black_pct > 0)
 
+    # Plain row mappings, not ORM objects: this path is read-only
     results = []
-    for m in query.all():
-        dist = haversine_km(lat, lon, m.lat, m.lon)
+    for row in session.execute(query).mappings():
+        dist = haversine_km(lat, lon, row["lat"], row["lon"])
         if dist <= max_distance_km:
-            results.append({
-                "id": m.id,
-                "name": m.name,
-                "state": m.state,
-                "lat": m.lat,
-                "lon": m.lon,
-                "vertical_drop": m.vertical_drop,
-                "num_trails": m.num_trails,
-                "num_lifts": m.num_lifts,
-                "green_pct": m.green_pct,
-                "blue_pct": m.blue_pct,
-                "black_pct": m.black_pct,
-                "double_black_pct": m.double_black_pct,
-                "terrain_parks": m.terrain_parks,
-                "glades": m.glades,
-                "pass_types": m.pass_types,
-                "allows_snowboarding": m.allows_snowboarding,
-                "lift_types": m.lift_types,
-                "has_night_skiing": m.has_night_skiing,
-                "avg_weekday_price": m.avg_weekday_price,
-                "avg_weekend_price": m.avg_weekend_price,
-                "snowmaking_pct": m.snowmaking_pct,
-                "has_magic_carpet": m.has_magic_carpet,
-                "has_ski_school": m.has_ski_school,
-                "learning_area_quality": m.learning_area_quality,
-                "distance_km": round(dist, 1),
-            })
+            results.append({**row, "distance_km": round(dist, 1)})
 
     return sorted(results, key=lambda x: x["distance_km"])
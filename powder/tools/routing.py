@@ -4,6 +4,8 @@ import os
 import httpx
 from dotenv import load_dotenv
 
+from powder.tools.cache import ttl_cache
+
 load_dotenv()
 
 BASE_URL = "https://api.openrouteservice.org/v2/directions/driving-car"
@@ -19,6 +21,8 @@ def estimate_max_distance_km(max_drive_hours: float) -> float:
     return max_drive_hours * 120
 
 
+# Drive times between fixed points barely change; cache them for a day
+@ttl_cache(ttl_seconds=24 * 60 * 60)
 def get_drive_time(
     start_lat: float,
     start_lon: float,
@@ -3,6 +3,8 @@
 import httpx
 from datetime import date
 
+from powder.tools.cache import ttl_cache
+
 
 BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
@@ -26,9 +28,17 @@ def get_conditions(lat: float, lon: float, target_date: date | None = None) -> d
             - weather_code: WMO weather code
             - weather_description: Human-readable weather
     """
+    # Resolve the default before the cache lookup so the key is the real date;
+    # a None key would serve yesterday's forecast as today's after midnight
     if target_date is None:
         target_date = date.today()
+    return _fetch_conditions(lat, lon, target_date)
+
 
+# Forecasts update hourly at most; 15 minutes keeps repeat queries off the API
+@ttl_cache(ttl_seconds=15 * 60)
+def _fetch_conditions(lat: float, lon: float, target_date: date) -> dict:
+    """Fetch the Open-Meteo forecast and extract conditions for target_date."""
     params = {
         "latitude": lat,
         "longitude": lon,
@@ -0,0 +1,80 @@
+"""Tests for the tool TTL cache."""
+
+from unittest.mock import patch
+
+from powder.tools.cache import ttl_cache
+
+
+def make_counted(**cache_kwargs):
+    """Cached function that records how often it actually runs."""
+    calls = []
+
+    @ttl_cache(**cache_kwargs)
+    def lookup(lat: float, lon: float) -> dict:
+        calls.append((lat, lon))
+        return {"lat": lat, "lon": lon}
+
+    return lookup, calls
+
+
+def test_hits_until_ttl_expires():
+    """Repeat calls are served from cache until the TTL passes."""
+    lookup, calls = make_counted(ttl_seconds=60)
+
+    with patch("powder.tools.cache.time.monotonic", return_value=0.0):
+        lookup(44.5, -72.8)
+        lookup(44.5, -72.8)
+    assert len(calls) == 1
+
+    with patch("powder.tools.cache.time.monotonic", return_value=61.0):
+        lookup(44.5, -72.8)
+    assert len(calls) == 2
+
+
+def test_nearby_coordinates_share_an_entry():
+    """Coordinates equal to 3 decimals hit the same entry."""
+    lookup, calls = make_counted(ttl_seconds=60)
+
+    lookup(44.52581, -72.78581)
+    lookup(44.52584, -72.78579)
+    lookup(44.6, -72.8)
+
+    assert len(calls) == 2
+
+
+def test_cached_value_cannot_be_modified_by_callers():
+    """Callers get a copy, so mutating it doesn't change later hits."""
+    lookup, _ = make_counted(ttl_seconds=60)
+
+    lookup(44.5, -72.8)["lat"] = 0.0
+
+    assert lookup(44.5, -72.8)["lat"] == 44.5
+
+
+def test_nested_cached_value_cannot_be_modified_by_callers():
+    """Nested lists in a result are copied too, not shared with the cache."""
+    calls = []
+
+    @ttl_cache(ttl_seconds=60)
+    def forecast(lat: float, lon: float) -> dict:
+        calls.append((lat, lon))
+        return {"daily": [{"snow_cm": 10}]}
+
+    first = forecast(44.5, -72.8)
+    first["daily"][0]["snow_cm"] = 0
+    first["daily"].append({"snow_cm": 99})
+
+    assert forecast(44.5, -72.8) == {"daily": [{"snow_cm": 10}]}
+    assert len(calls) == 1
+
+
+def test_evicts_oldest_past_maxsize():
+    """The oldest entry is dropped once the cache is full."""
+    lookup, calls = make_counted(ttl_seconds=60, maxsize=2)
+
+    lookup(1.0, 0.0)
+    lookup(2.0, 0.0)
+    lookup(3.0, 0.0)
+    lookup(1.0, 0.0)
+
+    assert len(calls) == 4
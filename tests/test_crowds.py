@@ -98,6 +98,12 @@ class TestVacationWeeks:
         assert result["crowd_level"] == "moderate"
         assert "escape" in result["crowd_note"].lower() or "fewer" in result["crowd_note"].lower()
 
+    def test_ny_vacation_week_latest_end(self):
+        # Presidents Day on Feb 21 (2022) pushes NY vacation to Sunday Mar 6
+        result = get_crowd_context(date(2022, 3, 6), "VT")
+        assert result["vacation_week"] == "NY"
+        assert result["crowd_level"] == "extreme"
+
 
 class TestRegularDays:
     """Test non-holiday periods."""
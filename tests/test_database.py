@@ -9,6 +9,7 @@ from powder.tools.database import (
     init_db,
     query_mountains,
     haversine_km,
+    bounding_box,
 )
 
 # Boston coordinates for testing
@@ -164,6 +165,29 @@ def test_haversine_km():
     assert 300 < dist < 320
 
 
+@pytest.mark.parametrize(
+    "origin,max_distance_km",
+    [
+        ((BOSTON_LAT, BOSTON_LON), 150),
+        ((BOSTON_LAT, BOSTON_LON), 500),
+        ((44.5, -72.8), 300),
+        ((65.0, -150.0), 800),  # High latitude, where longitude degrees shrink
+    ],
+)
+def test_bounding_box_contains_radius(origin, max_distance_km):
+    """Every point within the radius falls inside the SQL prefilter box."""
+    lat, lon = origin
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, max_distance_km)
+
+    # Sweep a grid around the origin wide enough to cover the whole circle
+    for i in range(-100, 101):
+        for j in range(-100, 101):
+            point_lat, point_lon = lat + i * 0.1, lon + j * 0.25
+            if haversine_km(lat, lon, point_lat, point_lon) <= max_distance_km:
+                assert min_lat <= point_lat <= max_lat
+                assert min_lon <= point_lon <= max_lon
+
+
 def test_query_all_mountains(db_session):
     """Test querying all mountains within range."""
     results = query_mountains(db_session, BOSTON_LAT, BOSTON_LON, max_distance_km=500)
@@ -1,6 +1,8 @@
 """Tests for evaluation framework - ensures datasets and metrics work correctly."""
 
 import json
+from dataclasses import replace
+from types import SimpleNamespace
 import pytest
 import dspy
 
@@ -69,6 +71,22 @@ class TestParseQueryEval:
         score = parse_query.parse_query_metric(example, WrongPred())
         assert score < 1.0
 
+    def test_metric_matches_detailed_scores_for_booleans(self):
+        """Booleans score the same in the metric and score_detailed, None included."""
+        example = parse_query.make_example(
+            "q",
+            "ctx",
+            {"expected_needs_glades": None, "expected_needs_terrain_parks": True},
+        )
+
+        class Pred:
+            parsed = SimpleNamespace(needs_glades=None, needs_terrain_parks=False)
+
+        details = parse_query.score_detailed(example, Pred())
+        assert details["needs_glades"]["score"] == 1.0
+        assert details["needs_terrain_parks"]["score"] == 0.0
+        assert parse_query.parse_query_metric(example, Pred()) == 0.5
+
 
 class TestScoreMountainEval:
     """Tests for ScoreMountain evaluation."""
@@ -86,6 +104,9 @@ class TestScoreMountainEval:
             prefs = json.loads(ex.user_preferences)
             assert "name" in mountain
             assert isinstance(prefs, dict)
+            # Name label is kept for reports but never sent to the LM
+            assert ex.mountain_name == mountain["name"]
+            assert "mountain_name" not in ex.inputs()
 
     def test_metric_validates_score_range(self):
         """Metric checks that score is 0-100."""
@@ -108,6 +129,29 @@ class TestScoreMountainEval:
 
         assert valid_score > invalid_score
 
+    def test_metric_checks_keywords_of_example_built_without_make_example(self):
+        """Hand-built examples without *_lower fields still get keyword checks."""
+        expected = {
+            "expected_pros_mention": ["Powder", "Glades"],
+            "expected_cons_mention": ["Drive"],
+        }
+        hand_built = dspy.Example(**expected)
+        made = score_mountain.make_example(
+            score_mountain.STOWE_POWDER, {}, "day", expected
+        )
+
+        class MissPred:
+            score = 85
+            key_pros = "Nice views"
+            key_cons = "Pricey tickets"
+            tradeoff_note = "Best snow but furthest"
+
+        score = score_mountain.score_mountain_metric(hand_built, MissPred())
+
+        # Validity and tradeoff pass; both keyword checks fail
+        assert score == 0.5
+        assert score == score_mountain.score_mountain_metric(made, MissPred())
+
 
 class TestGenerateRecommendationEval:
     """Tests for GenerateRecommendation evaluation."""
@@ -140,6 +184,32 @@ class TestGenerateRecommendationEval:
 
         assert correct_score > wrong_score
 
+    def test_metric_accepts_example_built_without_make_example(self):
+        """Hand-built examples without *_lower fields score like make_example ones."""
+        expected = {
+            "expected_top_pick": ["Stowe"],
+            "expected_alternatives_mention": ["Sugarbush"],
+            "expected_caveat_keywords": ["crowd"],
+        }
+        hand_built = dspy.Example(**expected)
+        made = generate_recommendation.make_example("q", "day", [], {}, expected)
+
+        class Pred:
+            top_pick = "I recommend Stowe for the best powder conditions."
+            alternatives = "Sugarbush is a good backup option."
+            caveat = "Expect crowds on the weekend."
+
+        score = generate_recommendation.generate_recommendation_metric(
+            hand_built, Pred()
+        )
+
+        assert score == 1.0
+        assert score == generate_recommendation.generate_recommendation_metric(
+            made, Pred()
+        )
+        details = generate_recommendation.score_detailed(hand_built, Pred())
+        assert details["top_pick_check"]["found"] == ["Stowe"]
+
 
 class TestAssessConditionsEval:
     """Tests for AssessConditions evaluation."""
@@ -292,3 +362,174 @@ class TestEvalDatasetCoverage:
             locations.add(ex.user_location["name"])
 
         assert len(locations) >= 2  # At least Boston and NYC
+
+
+class TestDayMetrics:
+    """Tests for precomputed day metrics used by find_interesting_days."""
+
+    def test_day_metrics_round_trip(self, tmp_path):
+        """Saved metrics load back identical to freshly computed ones."""
+        from powder.evals.find_interesting_days import (
+            analyze_all_days,
+            load_day_metrics,
+            save_day_metrics,
+        )
+
+        data = {
+            "mountains": ["Stowe", "Killington", "Jay Peak"],
+            "dates": {
+                "2025-01-15": {
+                    "Stowe": {"fresh_snow_24h_in": 8.0, "temp_f": -2.0},
+                    "Killington": {"fresh_snow_24h_in": 3.0, "temp_f": 5.0},
+                    "Jay Peak": {"fresh_snow_24h_in": 0.7, "temp_f": -4.5},
+                },
+                "2025-01-16": {
+                    "Stowe": {"fresh_snow_24h_in": 0.5, "temp_f": 20.0},
+                    "Killington": {"fresh_snow_24h_in": 1.0, "temp_f": 22.0},
+                    "Jay Peak": {"fresh_snow_24h_in": None, "temp_f": None},
+                },
+            },
+        }
+
+        save_day_metrics(data, tmp_path)
+        analyses, mountains = load_day_metrics(tmp_path)
+        expected = analyze_all_days(data)
+
+        assert mountains == ["Stowe", "Killington", "Jay Peak"]
+        # Loaded analyses carry no per-mountain conditions; every metric matches
+        assert analyses == [replace(e, mountains={}) for e in expected]
+        assert analyses[0].best_snow_mountain == "Stowe"
+        assert analyses[0].coldest_mountain == "Jay Peak"
+
+    def test_load_day_metrics_missing_file(self, tmp_path):
+        """Missing metrics file returns None so callers fall back to by_date.json."""
+        from powder.evals.find_interesting_days import load_day_metrics
+
+        assert load_day_metrics(tmp_path) is None
+
+
+class TestSummarizeDays:
+    """Tests for the metadata.json summary lists built at fetch time."""
+
+    def test_thresholds_and_ordering(self):
+        """6+ inch days ranked by snow, sub-zero days ranked coldest first."""
+        from powder.evals.fetch_historic import summarize_days
+
+        by_date = {
+            "2025-01-01": {
+                "Stowe": {"fresh_snow_24h_in": 6.0, "temp_f": 0.0},
+                "Killington": {"fresh_snow_24h_in": 2.0, "temp_f": 10.0},
+            },
+            "2025-01-02": {
+                "Stowe": {"fresh_snow_24h_in": 5.9, "temp_f": -1.0},
+                "Killington": {"fresh_snow_24h_in": 1.0, "temp_f": -8.0},
+            },
+            "2025-01-03": {
+                "Stowe": {"fresh_snow_24h_in": 4.0, "temp_f": -3.0},
+                "Killington": {"fresh_snow_24h_in": 12.0, "temp_f": 1.0},
+            },
+            "2025-01-04": {"Stowe": {}},
+        }
+
+        powder_days, cold_days = summarize_days(by_date)
+
+        assert powder_days == [
+            {"date": "2025-01-03", "mountain": "Killington", "fresh_snow_in": 12.0},
+            {"date": "2025-01-01", "mountain": "Stowe", "fresh_snow_in": 6.0},
+        ]
+        assert cold_days == [
+            {"date": "2025-01-02", "temp_f": -8.0},
+            {"date": "2025-01-03", "temp_f": -3.0},
+        ]
+
+    def test_limits(self):
+        from powder.evals.fetch_historic import summarize_days
+
+        by_date = {
+            f"2025-01-{day:02d}": {"Stowe": {"fresh_snow_24h_in": day, "temp_f": -day}}
+            for day in range(6, 12)
+        }
+
+        powder_days, cold_days = summarize_days(by_date, powder_limit=2, cold_limit=3)
+
+        assert [d["fresh_snow_in"] for d in powder_days] == [11, 10]
+        assert [d["temp_f"] for d in cold_days] == [-11, -10, -9]
+
+
+class TestBacktestMocks:
+    """Tests for the mocked weather API used by end-to-end evals."""
+
+    def test_weather_mock_serves_each_contexts_fixture(self):
+        """Concurrent examples under one patch each see their own conditions."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+
+        import powder.pipeline
+        from powder.evals.backtest import mock_weather_api_by_context, use_conditions
+
+        def run(snow):
+            with use_conditions({"Stowe": {"fresh_snow_24h_in": snow}}):
+                return powder.pipeline.get_conditions(44.5, -72.8, None)
+
+        with patch(
+            "powder.evals.backtest.find_mountain_by_coords",
+            lambda lat, lon, conditions: ("Stowe", conditions["Stowe"]),
+        ), mock_weather_api_by_context():
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(run, range(8)))
+
+        assert [r["fresh_snow_24h_in"] for r in results] == list(range(8))
+
+
+class TestRunner:
+    """Tests for the eval runner's results log."""
+
+    def test_concurrent_signature_evals_share_one_log(self):
+        """Every example of every eval lands as one whole JSON line."""
+        import io
+        from concurrent.futures import ThreadPoolExecutor
+
+        from powder.evals.runner import run_signature_eval
+
+        examples = [dspy.Example(text=str(i)).with_inputs("text") for i in range(20)]
+        log = io.StringIO()
+
+        def run(name):
+            return run_signature_eval(
+                name,
+                examples,
+                predictor=lambda text: dspy.Prediction(text=text),
+                metric_fn=lambda ex, pred: 1.0,
+                results_log=log,
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(run, ["A", "B", "C", "D"]))
+
+        records = [json.loads(line) for line in log.getvalue().splitlines()]
+        assert len(records) == 80
+        assert {(r["signature"], r["example"]) for r in records} == {
+            (name, i) for name in "ABCD" for i in range(1, 21)
+        }
+
+    def test_slot_wait_timeout_is_recorded_as_error(self):
+        """An example that can't get an LM slot fails instead of hanging the run."""
+        import threading
+        from unittest.mock import patch
+
+        from powder.evals import runner
+
+        examples = [dspy.Example(text="a").with_inputs("text")]
+        with (
+            patch.object(runner, "_LM_SLOTS", threading.BoundedSemaphore(0)),
+            patch.object(runner, "EXAMPLE_TIMEOUT_S", 0.01),
+        ):
+            result = runner.run_signature_eval(
+                "A",
+                examples,
+                predictor=lambda text: dspy.Prediction(text=text),
+                metric_fn=lambda ex, pred: 1.0,
+            )
+
+        assert result["scores"] == [0.0]
+        assert "no LM slot free" in result["failures"][0]["error"]
@@ -1,6 +1,7 @@
 """Smoke tests for the SkiPipeline.
 
-These are minimal integration tests to verify the pipeline works end-to-end.
+The smoke tests are minimal integration tests to verify the pipeline works
+end-to-end; the rest stub out the LM to test the scoring fallbacks.
 Detailed behavior testing is done via the eval framework in powder/evals/.
 
 Run with: .venv/bin/python -m pytest tests/test_pipeline.py -v -s
@@ -14,16 +15,14 @@ import pytest
 import dspy
 
 from powder.pipeline import SkiPipeline
+from powder.signatures import MountainScore, ParsedQuery
 
 
-# Mark all tests as requiring LLM, skip if no API key
-pytestmark = [
-    pytest.mark.llm,
-    pytest.mark.skipif(
-        not os.getenv("ANTHROPIC_API_KEY"),
-        reason="ANTHROPIC_API_KEY not set",
-    ),
-]
+# Smoke tests call the real LLM; skip them if no API key
+requires_api_key = pytest.mark.skipif(
+    not os.getenv("ANTHROPIC_API_KEY"),
+    reason="ANTHROPIC_API_KEY not set",
+)
 
 
 TEST_DATE = "2025-01-08"
@@ -61,6 +60,8 @@ def configure_lm():
     dspy.configure(lm=dspy.LM("anthropic/claude-haiku-4-5-20251001"))
 
 
+@pytest.mark.llm
+@requires_api_key
 def test_pipeline_smoke():
     """Smoke test: pipeline produces a recommendation with expected structure."""
     pipeline = SkiPipeline()
@@ -75,3 +76,139 @@ def test_pipeline_smoke():
     assert result.parsed is not None
     assert isinstance(result.candidates, list)
     assert isinstance(result.scores, list)
+
+
+# --- Scoring with a stubbed LM ---
+
+
+def _candidate(name: str) -> dict:
+    return {"name": name, "state": "VT", "lat": 44.0, "lon": -72.0}
+
+
+def _entry(name: str, score: float) -> MountainScore:
+    return MountainScore(
+        name=name, score=score, key_pros="pros", key_cons="cons", tradeoff_note=""
+    )
+
+
+def _batch_pipeline(scores: list[MountainScore]) -> SkiPipeline:
+    """Pipeline whose ScoreMountains call returns `scores`."""
+    pipeline = SkiPipeline(use_optimized=False, use_batch_scoring=True)
+    pipeline.score_mountains = MagicMock(return_value=dspy.Prediction(scores=scores))
+    return pipeline
+
+
+class TestScoreBatch:
+    def test_reordered_entries_match_by_name(self):
+        pipeline = _batch_pipeline([_entry("stowe ", 80), _entry("Killington", 40)])
+        candidates = [_candidate("Killington"), _candidate("Stowe")]
+
+        scored = pipeline._score_batch(candidates, "[]", "{}", "")
+
+        assert [s["mountain"]["name"] for s in scored] == ["Killington", "Stowe"]
+        assert [s["score"] for s in scored] == [40, 80]
+
+    def test_missing_name_returns_none(self):
+        pipeline = _batch_pipeline([_entry("Stowe", 80), _entry("Sugarbush", 60)])
+        candidates = [_candidate("Killington"), _candidate("Stowe")]
+
+        assert pipeline._score_batch(candidates, "[]", "{}", "") is None
+
+    def test_forward_falls_back_to_per_mountain_scoring(self):
+        pipeline = _batch_pipeline([_entry("Stowe", 80)])
+        candidates = [_candidate("Killington"), _candidate("Stowe")]
+        pipeline.parse_query = MagicMock()
+        pipeline.assess_conditions = MagicMock(
+            return_value=dspy.Prediction(
+                day_quality="good", best_available="Stowe", day_context=""
+            )
+        )
+        pipeline.generate_recommendation = MagicMock(
+            return_value=dspy.Prediction(
+                top_pick="Killington", alternatives="", caveat=""
+            )
+        )
+        per_mountain = [
+            {
+                "mountain": c,
+                "score": 50,
+                "key_pros": "",
+                "key_cons": "",
+                "tradeoff_note": "",
+            }
+            for c in candidates
+        ]
+
+        with (
+            patch.object(pipeline, "_search_mountains", return_value=candidates),
+            patch.object(pipeline, "_enrich", side_effect=lambda c, *args: c),
+            patch.object(
+                pipeline, "_score_each", return_value=per_mountain
+            ) as score_each,
+        ):
+            result = pipeline(
+                query="Best skiing in Vermont today?",
+                current_date=date.fromisoformat(TEST_DATE),
+                parsed=ParsedQuery(target_date="today"),
+            )
+
+        score_each.assert_called_once()
+        assert result.scores == per_mountain
+
+
+class TestFanOut:
+    def test_enrich_falls_back_to_estimate_when_one_route_fails(self):
+        pipeline = SkiPipeline(use_optimized=False)
+        candidates = [_candidate("Killington"), _candidate("Stowe")]
+        candidates[1].update(lat=44.5, distance_km=200)
+
+        def drive_time(user_lat, user_lon, lat, lon):
+            if lat == 44.5:
+                raise RuntimeError("routing down")
+            return {"duration_minutes": 90, "distance_km": 120}
+
+        with (
+            patch("powder.pipeline.get_conditions", return_value={"temperature_f": 20}),
+            patch("powder.pipeline.get_drive_time", side_effect=drive_time),
+        ):
+            enriched = pipeline._enrich(candidates, date(2025, 1, 8), 42.0, -71.0)
+
+        assert enriched[0]["drive_time"] == {"duration_minutes": 90, "distance_km": 120}
+        assert enriched[1]["drive_time"]["error"] == "routing_api_failed"
+        assert enriched[1]["drive_time"]["duration_minutes"] == 150
+        assert all(m["conditions"] == {"temperature_f": 20} for m in enriched)
+
+    def test_enrich_raises_when_a_forecast_fails(self):
+        pipeline = SkiPipeline(use_optimized=False)
+        candidates = [_candidate("Killington"), _candidate("Stowe")]
+
+        with (
+            patch(
+                "powder.pipeline.get_conditions",
+                side_effect=[{"temperature_f": 20}, ValueError("not in range")],
+            ),
+            patch("powder.pipeline.get_drive_time", return_value={}),
+            pytest.raises(ValueError),
+        ):
+            pipeline._enrich(candidates, date(2025, 1, 8), 42.0, -71.0)
+
+    def test_score_each_ranks_failed_calls_last_and_calls_once(self):
+        pipeline = SkiPipeline(use_optimized=False)
+        candidates = [_candidate("Killington"), _candidate("Stowe")]
+
+        def score(mountain, user_preferences, day_context):
+            if "Stowe" in mountain:
+                raise RuntimeError("LM error")
+            return dspy.Prediction(
+                score=120, key_pros="pros", key_cons="cons", tradeoff_note=""
+            )
+
+        pipeline.score_mountain = MagicMock(side_effect=score)
+        mountain_json = ['{"name": "Killington"}', '{"name": "Stowe"}']
+
+        scored = pipeline._score_each(candidates, mountain_json, "{}", "")
+
+        assert pipeline.score_mountain.call_count == 2
+        assert scored[0]["score"] == 100
+        assert scored[1]["score"] == 0
+        assert scored[1]["key_cons"] == "error: could not score this mountain"
@@ -6,6 +6,12 @@ from unittest.mock import patch, MagicMock
 from powder.tools.routing import get_drive_time, get_drive_times_batch, estimate_max_distance_km
 
 
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Each test mocks its own API response, so never serve a cached one."""
+    get_drive_time.cache_clear()
+
+
 def make_mock_response(duration_sec: float, distance_m: float) -> dict:
     """Helper to create mock ORS API response."""
     return {
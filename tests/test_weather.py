@@ -4,7 +4,17 @@ import pytest
 from datetime import date
 from unittest.mock import patch, MagicMock
 
-from powder.tools.weather import get_conditions, _weather_code_to_description
+from powder.tools.weather import (
+    get_conditions,
+    _fetch_conditions,
+    _weather_code_to_description,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Each test mocks its own API response, so never serve a cached one."""
+    _fetch_conditions.cache_clear()
 
 
 def make_mock_response(target_date: date, snow_depth_m: float, snowfall_hourly: list[float], temp_c: float = -5.0):
@@ -55,6 +65,38 @@ class TestSnowCalculations:
             assert result["snow_depth_cm"] == expected_depth_cm
 
 
+class TestCaching:
+    """Test the forecast cache around get_conditions."""
+
+    def test_default_date_is_not_served_across_midnight(self):
+        """A call without target_date after midnight fetches the new day."""
+        day1, day2 = date(2024, 1, 15), date(2024, 1, 16)
+        day1_response = make_mock_response(day1, 0.50, [0] * 13)
+        day2_response = make_mock_response(day2, 0.75, [2.0] * 13)
+        # One forecast covering both days, as the real 7-day response does
+        for key, values in day2_response["hourly"].items():
+            day1_response["hourly"][key] = day1_response["hourly"][key] + values
+
+        with patch("powder.tools.weather.httpx.get") as mock_get, patch(
+            "powder.tools.weather.date"
+        ) as mock_date, patch("powder.tools.cache.time.monotonic") as mock_clock:
+            mock_get.return_value = MagicMock(json=MagicMock(return_value=day1_response))
+
+            # 23:55 on day 1, then 23:57 (cached), then 00:05 on day 2 (within TTL)
+            mock_date.today.return_value = day1
+            mock_clock.return_value = 0.0
+            before = get_conditions(44.5, -72.8)
+            mock_clock.return_value = 120.0
+            get_conditions(44.5, -72.8)
+            mock_date.today.return_value = day2
+            mock_clock.return_value = 600.0
+            after = get_conditions(44.5, -72.8)
+
+        assert mock_get.call_count == 2
+        assert before["snow_depth_cm"] == 50.0
+        assert after["snow_depth_cm"] == 75.0
+
+
 class TestUnitConversions:
     """Test metric to imperial conversions."""
 